@@ -7,6 +7,7 @@ import asyncio
 import os
 import json
 import logging
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from cachetools import TTLCache
@@ -52,9 +53,21 @@ class ExternalAPIManager:
 class NHTSAApi:
     """NHTSA (National Highway Traffic Safety Administration) API client"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = "https://vpic.nhtsa.dot.gov/api"
         self.cache = TTLCache(maxsize=500, ttl=86400)  # Cache for 24 hours
+        # Shared, caller-owned session whose ClientTimeout applies to every request;
+        # without one a session with a 10s timeout is opened per call
+        self.session = session
+    
+    @asynccontextmanager
+    async def _session(self):
+        """Yield the shared session, or a short-lived one if none was given"""
+        if self.session is not None:
+            yield self.session
+        else:
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+                yield session
         
     async def decode_vin(self, vin: str) -> Dict[str, Any]:
         """
@@ -70,8 +83,8 @@ class NHTSAApi:
         try:
             url = f"{self.base_url}/vehicles/DecodeVin/{vin}?format=json"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
+            async with self._session() as session:
+                async with session.get(url) as response:
                     if response.status == 200:
                         data = await response.json()
                         
@@ -195,8 +208,8 @@ class NHTSAApi:
                 "format": "json"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=10) as response:
+            async with self._session() as session:
+                async with session.get(url, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
                         recalls = self._parse_recall_response(data)
@@ -43,13 +43,14 @@ class VehicleData:
 
 class VINDecoder:
     """VIN decoder with NHTSA API integration and fallback to local decoding"""
-    def __init__(self, use_nhtsa_api: bool = None):
+    def __init__(self, use_nhtsa_api: bool = None, session: Optional[aiohttp.ClientSession] = None):
         if use_nhtsa_api is None:
             # Read from environment variable
             use_nhtsa_api = os.getenv('NHTSA_API_ENABLED', 'true').lower() == 'true'
         self.valid_pattern = re.compile(r'^[A-HJ-NPR-Z0-9]{17}$')
         self.use_nhtsa_api = use_nhtsa_api
-        self.nhtsa_api = NHTSAApi() if use_nhtsa_api else None
+        # An optional caller-owned session is passed through to NHTSAApi for pooling
+        self.nhtsa_api = NHTSAApi(session=session) if use_nhtsa_api else None
         # Mock database of vehicle information (fallback)
         self.vehicle_db = self._init_vehicle_db()
 
@@ -88,8 +89,32 @@ class VINDecoder:
                     loop.close()
             except Exception as e:
                 logger.warning(f"NHTSA API failed for VIN {vin}, using fallback: {e}")
-        
-        # Fallback to local decode
+
+        return self._local_decode(vin)
+
+    async def decode_async(self, vin: str) -> Dict[str, Any]:
+        """Decode a VIN from async code, awaiting NHTSA on the caller's loop"""
+        if not self.validate(vin):
+            raise ValueError(f"Invalid VIN: {vin}")
+
+        if self.use_nhtsa_api and self.nhtsa_api:
+            try:
+                vehicle_info = await self.nhtsa_api.decode_vin(vin)
+                if vehicle_info and vehicle_info.get("make"):
+                    logger.info(f"Successfully decoded VIN {vin} using NHTSA API")
+                    return {
+                        "vin": vin,
+                        "valid": True,
+                        "source": "nhtsa",
+                        **vehicle_info
+                    }
+            except Exception as e:
+                logger.warning(f"NHTSA API failed for VIN {vin}, using fallback: {e}")
+
+        return self._local_decode(vin)
+
+    def _local_decode(self, vin: str) -> Dict[str, Any]:
+        """Decode a VIN locally when NHTSA is disabled or unavailable"""
         logger.info(f"Using local decode for VIN {vin}")
         
         # Extract information from VIN
@@ -264,8 +289,24 @@ class VINDecoder:
                     loop.close()
             except Exception as e:
                 logger.warning(f"NHTSA recall API failed for VIN {vin}: {e}")
-        
-        # Fallback to mock recall data
+
+        return self._mock_recalls(vin)
+
+    async def get_recalls_async(self, vin: str) -> list:
+        """Get recall information from async code, falling back to mock data"""
+        if self.use_nhtsa_api and self.nhtsa_api:
+            try:
+                recalls = await self.nhtsa_api.get_recall_info(vin)
+                if recalls:
+                    logger.info(f"Found {len(recalls)} recalls for VIN {vin} from NHTSA")
+                    return recalls
+            except Exception as e:
+                logger.warning(f"NHTSA recall API failed for VIN {vin}: {e}")
+
+        return self._mock_recalls(vin)
+
+    def _mock_recalls(self, vin: str) -> list:
+        """Mock recall data used when NHTSA returns nothing"""
         logger.info(f"Using mock recalls for VIN {vin}")
         recalls = [
             {
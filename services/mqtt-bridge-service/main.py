@@ -14,9 +14,9 @@ import asyncio
 import json
 from pathlib import Path
 import paho.mqtt.client as mqtt
-from datetime import datetime
 import threading
 import queue
+import time
 
 # Add backend and infrastructure paths for imports
 backend_path = Path(__file__).parent.parent.parent / "backend"
@@ -52,6 +52,11 @@ mqtt_client = None
 sensor_data_queue = queue.Queue(maxsize=1000)
 connected_websockets = []
 mqtt_connected = False
+event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Second-resolution ISO prefix reused for every message within that second
+_last_sec = 0
+_last_iso = ""
 
 class SensorData(BaseModel):
     vehicle_id: str
@@ -86,18 +91,35 @@ def on_mqtt_connect(client, userdata, flags, rc):
         mqtt_connected = False
         print(f"❌ Failed to connect to MQTT broker: {rc}")
 
+def _iso_timestamp() -> str:
+    """Local ISO-8601 timestamp, reformatting the date part once per second"""
+    global _last_sec, _last_iso
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    if sec != _last_sec:
+        _last_sec = sec
+        _last_iso = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+    return f"{_last_iso}.{ns // 1000:06d}"
+
 def on_mqtt_message(client, userdata, msg):
-    """MQTT message callback"""
+    """MQTT message callback
+
+    Runs on paho's network thread, so only hand the raw message over to the
+    event loop and return straight away to keep the socket reader free.
+    """
+    if event_loop is not None:
+        event_loop.call_soon_threadsafe(_ingest, msg.topic, msg.payload, msg.qos)
+
+def _ingest(topic: str, raw_payload: bytes, qos: int):
+    """Parse, queue and broadcast an MQTT message on the event loop thread"""
     try:
-        topic = msg.topic
-        payload = json.loads(msg.payload.decode())
+        payload = json.loads(raw_payload.decode())
         
         # Add to sensor data queue
         sensor_data = {
             "topic": topic,
             "payload": payload,
-            "timestamp": datetime.now().isoformat(),
-            "qos": msg.qos
+            "timestamp": _iso_timestamp(),
+            "qos": qos
         }
         
         if not sensor_data_queue.full():
@@ -157,6 +179,8 @@ async def broadcast_to_websockets(data):
 @app.on_event("startup")
 async def startup_event():
     """Initialize MQTT connection on startup"""
+    global event_loop
+    event_loop = asyncio.get_running_loop()
     init_mqtt()
 
 @app.on_event("shutdown")
@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, validator
 import os
 import sys
+import aiohttp
 import uvicorn
 from pathlib import Path
 
@@ -18,7 +19,6 @@ sys.path.append(str(backend_path))
 sys.path.append(str(infrastructure_path))
 
 from vin_decoder import VINDecoder
-from external_apis import NHTSAApi
 from config import get_vin_decoder_port
 
 app = FastAPI(
@@ -36,7 +36,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global VIN decoder instance
+# Global VIN decoder instance, rebuilt on startup around the pooled HTTP session
 vin_decoder = VINDecoder()
 
 class VINRequest(BaseModel):
@@ -67,6 +67,21 @@ class HealthResponse(BaseModel):
     version: str
     port: int
 
+@app.on_event("startup")
+async def startup_event():
+    """Open the pooled HTTP session used for NHTSA lookups"""
+    global vin_decoder
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30),
+        timeout=aiohttp.ClientTimeout(total=5)
+    )
+    vin_decoder = VINDecoder(session=app.state.http)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the pooled HTTP session"""
+    await app.state.http.close()
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
@@ -86,7 +101,7 @@ async def decode_vin(vin: str):
             raise HTTPException(status_code=400, detail="VIN must be exactly 17 characters")
         
         # Decode VIN using the existing decoder
-        vehicle_data = vin_decoder.decode_vin(vin)
+        vehicle_data = await vin_decoder.decode_async(vin)
         
         if not vehicle_data:
             raise HTTPException(status_code=404, detail="Vehicle information not found")
@@ -126,7 +141,7 @@ async def get_recalls(vin: str):
         if len(vin) != 17:
             raise HTTPException(status_code=400, detail="VIN must be exactly 17 characters")
         
-        recalls = vin_decoder.get_recalls(vin)
+        recalls = await vin_decoder.get_recalls_async(vin)
         return {
             "vin": vin,
             "recalls": recalls if recalls else [],
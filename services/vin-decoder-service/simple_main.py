@@ -57,29 +57,39 @@ def service_info():
         "port": int(os.getenv("PORT", "8001"))
     }
 
-@app.get("/api/vin/validate/{vin}")
-def validate_vin(vin: str):
-    """Validate VIN format"""
+def _vin_error(vin_u: str):
+    """Return the validation error for an upper-cased VIN, or None if valid"""
     # Simple VIN validation
-    if len(vin) != 17:
-        return {"valid": False, "error": "VIN must be 17 characters"}
+    if len(vin_u) != 17:
+        return "VIN must be 17 characters"
     
     # VIN should not contain I, O, or Q
-    if any(char in vin.upper() for char in "IOQ"):
-        return {"valid": False, "error": "VIN cannot contain I, O, or Q"}
+    if any(char in vin_u for char in "IOQ"):
+        return "VIN cannot contain I, O, or Q"
+    
+    return None
+
+@app.get("/api/vin/validate/{vin}")
+def validate_vin(vin: str):
+    """Validate VIN format"""
+    vin_u = vin.upper()
+    error = _vin_error(vin_u)
+    if error:
+        return {"valid": False, "error": error}
     
-    return {"valid": True, "vin": vin.upper()}
+    return {"valid": True, "vin": vin_u}
 
 @app.get("/api/vin/decode/{vin}")
 def decode_vin(vin: str):
     """Decode VIN (simplified version)"""
-    validation = validate_vin(vin)
-    if not validation["valid"]:
-        raise HTTPException(status_code=400, detail=validation["error"])
+    vin_u = vin.upper()
+    error = _vin_error(vin_u)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
     
     # Simplified decode
     return {
-        "vin": vin.upper(),
+        "vin": vin_u,
         "valid": True,
         "make": "Honda",  # Simplified
         "model": "Civic",
@@ -93,12 +103,13 @@ def decode_vin(vin: str):
 @app.get("/api/vin/recalls/{vin}")  
 def get_recalls(vin: str):
     """Get recall information (simplified)"""
-    validation = validate_vin(vin)
-    if not validation["valid"]:
-        raise HTTPException(status_code=400, detail=validation["error"])
+    vin_u = vin.upper()
+    error = _vin_error(vin_u)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
     
     return {
-        "vin": vin.upper(),
+        "vin": vin_u,
         "recalls": [],
         "total_recalls": 0,
         "source": "simplified"
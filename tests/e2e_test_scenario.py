@@ -5,16 +5,41 @@ Comprehensive testing of all system components from both service technician and
 """
 
 import asyncio
+import functools
 import json
 import time
 import os
+import socket
 import sys
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import aiohttp
 import paho.mqtt.client as mqtt
 from dotenv import load_dotenv
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    # Fall back to the stdlib codec when orjson isn't installed
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
 # Load environment variables
 load_dotenv()
 
@@ -25,28 +50,100 @@ REPORT_SERVICE_URL = os.getenv('REPORT_SERVICE_URL', 'http://localhost:3050')
 MQTT_HOST = os.getenv('MQTT_BROKER_HOST', 'localhost')
 MQTT_PORT = int(os.getenv('MQTT_BROKER_PORT', '1883'))
 MQTT_TOPIC = os.getenv('MQTT_BASE_TOPIC', 'motospect/v1')
+MQTT_QOS = int(os.getenv('MQTT_QOS', '0'))
 TEST_VIN = os.getenv('TEST_VIN', '1HGBH41JXMN109186')
 
-# Test results storage
+_BAR = '=' * 60
+
+# MQTT topics and endpoint URLs, built once from the configuration above
+OBD_TOPIC = f"{MQTT_TOPIC}/obd"
+AUDIO_TOPIC = f"{MQTT_TOPIC}/audio"
+THERMAL_TOPIC = f"{MQTT_TOPIC}/thermal"
+TOF_TOPIC = f"{MQTT_TOPIC}/tof"
+
+URL_VIN = f"{BACKEND_URL}/api/vin/{TEST_VIN}"
+URL_VEHICLE_DATABASE = f"{BACKEND_URL}/api/vehicle/database/{TEST_VIN}"
+URL_SCAN_START = f"{BACKEND_URL}/api/scan/start"
+URL_SCAN = f"{BACKEND_URL}/api/scan/"
+URL_OBD_AUTODETECT = f"{BACKEND_URL}/api/obd/auto-detect"
+URL_LATEST = f"{BACKEND_URL}/api/latest"
+URL_REPORT_GENERATE = f"{BACKEND_URL}/api/report/generate"
+URL_MAINTENANCE = f"{BACKEND_URL}/api/vehicle/maintenance"
+URL_COMMON_PROBLEMS = f"{BACKEND_URL}/api/vehicle/common-problems"
+URL_GATE_ENTER = f"{CUSTOMER_PORTAL_URL}/api/gate/enter"
+URL_REPORT_TEST = f"{REPORT_SERVICE_URL}/api/report/test"
+
+@dataclass
+class Summary:
+    """Pass/fail counters for the whole run
+    
+    Tests share one event loop thread and record() never awaits, so
+    concurrently gathered tests can update it without a lock.
+    """
+    total: int = 0
+    passed: int = 0
+    failed: int = 0
+    
+    def record(self, passed: int = 0, failed: int = 0, total: int = 0):
+        self.passed += passed
+        self.failed += failed
+        self.total += total
+
+SUMMARY = Summary()
+
+# Test results storage; the summary is filled in from SUMMARY when reporting
 test_results = {
     'timestamp': datetime.now().isoformat(),
     'vin': TEST_VIN,
     'tests': [],
-    'summary': {
-        'total': 0,
-        'passed': 0,
-        'failed': 0
-    }
+    'summary': {}
 }
 
+# Cached timestamp strings; formatting a datetime per log line/payload adds up
+_last_sec = 0
+_last_str = ''
+_last_iso_tick = -1
+_last_iso = ''
+
+def _fast_ts() -> str:
+    """HH:MM:SS for log lines, reformatted only when the second changes"""
+    global _last_sec, _last_str
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_sec = sec
+        _last_str = time.strftime('%H:%M:%S', time.localtime(sec))
+    return _last_str
+
+def _iso_now() -> str:
+    """ISO timestamp for MQTT payloads, refreshed at most every 100 ms"""
+    global _last_iso_tick, _last_iso
+    tick = time.monotonic_ns() // 100_000_000
+    if tick != _last_iso_tick:
+        _last_iso_tick = tick
+        _last_iso = datetime.now().isoformat()
+    return _last_iso
+
 class TestLogger:
-    """Logger for test results"""
+    """Logger for test results
+    
+    Log lines are buffered and written to stdout in one call per section
+    rather than one print() per line. Tests run through grouped() keep their
+    own buffer, so a gathered test's header and lines print as one block.
+    """
+    
+    _buffer: List[str] = []
+    _group: ContextVar[Optional[List[str]]] = ContextVar('test_logger_group', default=None)
+    
+    @staticmethod
+    def _lines() -> List[str]:
+        group = TestLogger._group.get()
+        return TestLogger._buffer if group is None else group
     
     @staticmethod
     def log(level: str, message: str):
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = _fast_ts()
         symbol = '✓' if level == 'PASS' else '✗' if level == 'FAIL' else '→'
-        print(f"[{timestamp}] {symbol} {message}")
+        TestLogger._lines().append(f"[{timestamp}] {symbol} {message}\n")
         
         test_results['tests'].append({
             'timestamp': timestamp,
@@ -54,141 +151,269 @@ class TestLogger:
             'message': message
         })
     
+    @staticmethod
+    def flush():
+        """Write out buffered log lines"""
+        if TestLogger._buffer:
+            sys.stdout.write(''.join(TestLogger._buffer))
+            TestLogger._buffer.clear()
+        sys.stdout.flush()
+    
     @staticmethod
     def section(title: str):
-        print(f"\n{'='*60}")
-        print(f"  {title}")
-        print(f"{'='*60}")
+        TestLogger._lines().append(f"\n{_BAR}\n  {title}\n{_BAR}\n")
+        if TestLogger._group.get() is None:
+            TestLogger.flush()
+    
+    @staticmethod
+    async def grouped(coro):
+        """Await coro with its output held back, then write it out in one block"""
+        group: List[str] = []
+        token = TestLogger._group.set(group)
+        try:
+            return await coro
+        finally:
+            TestLogger._group.reset(token)
+            TestLogger._buffer.extend(group)
+            TestLogger.flush()
 
 class MQTTSimulator:
     """Simulates sensor data via MQTT"""
     
+    # Constant payload bodies; only scan_id and timestamp vary per publish
+    _OBD_TEMPLATE = {
+        'channel': 'obd',
+        'vin': TEST_VIN,
+        'parameters': {
+            'rpm': 2500,
+            'engine_temp': 92,
+            'oil_pressure': 45,
+            'fuel_pressure': 380,
+            'battery_voltage': 14.2,
+            'throttle_position': 25,
+            'maf_rate': 12.5,
+            'o2_voltage': 0.45,
+            'vehicle_speed': 60
+        },
+        'fault_codes': ['P0301', 'P0171', 'B1234'],
+        'freeze_frame': {
+            'P0301': {
+                'rpm': 2800,
+                'engine_temp': 95,
+                'vehicle_speed': 45
+            }
+        }
+    }
+    
+    _AUDIO_TEMPLATE = {
+        'channel': 'audio',
+        'frequencies': [100, 500, 1000, 2000, 4000, 8000],
+        'amplitudes': [45, 62, 58, 41, 35, 28],
+        'peak_frequency': 500,
+        'peak_amplitude': 62,
+        'noise_level': 55,
+        'anomalies': ['bearing_noise', 'exhaust_leak']
+    }
+    
+    _THERMAL_TEMPLATE = {
+        'channel': 'thermal',
+        'zones': {
+            'engine': {'temp': 95, 'status': 'normal'},
+            'exhaust': {'temp': 280, 'status': 'normal'},
+            'brakes_front': {'temp': 120, 'status': 'normal'},
+            'brakes_rear': {'temp': 85, 'status': 'normal'},
+            'transmission': {'temp': 75, 'status': 'normal'}
+        },
+        'max_temp': 280,
+        'min_temp': 25,
+        'avg_temp': 115
+    }
+    
+    _TOF_TEMPLATE = {
+        'channel': 'tof',
+        'measurements': {
+            'ground_clearance': 180,
+            'tire_tread_depth': {
+                'front_left': 7.2,
+                'front_right': 7.5,
+                'rear_left': 6.8,
+                'rear_right': 6.9
+            },
+            'brake_pad_thickness': {
+                'front_left': 9.5,
+                'front_right': 9.2,
+                'rear_left': 8.8,
+                'rear_right': 8.7
+            }
+        }
+    }
+    
+    # Templates encoded once, with placeholders patched in by _render()
+    _OBD_PAYLOAD = _dumps({'scan_id': '__SID__', 'timestamp': '__TS__', **_OBD_TEMPLATE})
+    _AUDIO_PAYLOAD = _dumps({'scan_id': '__SID__', 'timestamp': '__TS__', **_AUDIO_TEMPLATE})
+    _THERMAL_PAYLOAD = _dumps({'scan_id': '__SID__', 'timestamp': '__TS__', **_THERMAL_TEMPLATE})
+    _TOF_PAYLOAD = _dumps({'scan_id': '__SID__', 'timestamp': '__TS__', **_TOF_TEMPLATE})
+    
     def __init__(self):
         self.client = mqtt.Client(client_id="e2e-test-simulator")
+        self.client.max_inflight_messages_set(100)
+        self.client.max_queued_messages_set(0)  # unlimited
+        self.client.on_connect = self._on_connect
+        self._connected_event = threading.Event()
+        self.started = False
         self.connected = False
         
     def connect(self):
-        """Connect to MQTT broker"""
+        """Start connecting to MQTT broker on paho's network thread
+        
+        Returns once the connect is scheduled; use wait_connected() to
+        block until the broker has accepted it.
+        """
         try:
-            self.client.connect(MQTT_HOST, MQTT_PORT, 60)
+            self.client.connect_async(MQTT_HOST, MQTT_PORT, 60)
             self.client.loop_start()
-            self.connected = True
-            TestLogger.log('PASS', f'Connected to MQTT broker at {MQTT_HOST}:{MQTT_PORT}')
+            self.started = True
             return True
         except Exception as e:
             TestLogger.log('FAIL', f'Failed to connect to MQTT: {e}')
             return False
     
+    def _on_connect(self, client, userdata, flags, rc):
+        """paho callback, runs on the network thread"""
+        if rc == 0:
+            self._tune_socket()
+            self.connected = True
+            self._connected_event.set()
+    
+    def wait_connected(self, timeout: float = 5.0) -> bool:
+        """Wait for the broker to accept the connection started by connect()"""
+        if self._connected_event.wait(timeout):
+            TestLogger.log('PASS', f'Connected to MQTT broker at {MQTT_HOST}:{MQTT_PORT}')
+            return True
+        TestLogger.log('FAIL', f'Failed to connect to MQTT broker at {MQTT_HOST}:{MQTT_PORT}')
+        return False
+    
+    def _tune_socket(self):
+        """Disable Nagle so each publish is sent immediately"""
+        sock = self.client.socket()
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)
+    
+    def _publish(self, topic: str, payload: bytes):
+        """Publish payload, waiting for the broker ack only when QoS > 0"""
+        info = self.client.publish(topic, payload, qos=MQTT_QOS)
+        if MQTT_QOS > 0:
+            info.wait_for_publish(timeout=1)
+        return info
+    
+    def _render(self, payload: bytes, scan_id: str) -> bytes:
+        """Fill in the scan id and timestamp of a pre-encoded payload"""
+        return (payload
+                .replace(b'"__SID__"', _dumps(scan_id), 1)
+                .replace(b'"__TS__"', _dumps(_iso_now()), 1))
+    
     def simulate_obd_data(self, scan_id: str):
         """Simulate OBD sensor data"""
-        obd_data = {
-            'scan_id': scan_id,
-            'timestamp': datetime.now().isoformat(),
-            'channel': 'obd',
-            'vin': TEST_VIN,
-            'parameters': {
-                'rpm': 2500,
-                'engine_temp': 92,
-                'oil_pressure': 45,
-                'fuel_pressure': 380,
-                'battery_voltage': 14.2,
-                'throttle_position': 25,
-                'maf_rate': 12.5,
-                'o2_voltage': 0.45,
-                'vehicle_speed': 60
-            },
-            'fault_codes': ['P0301', 'P0171', 'B1234'],
-            'freeze_frame': {
-                'P0301': {
-                    'rpm': 2800,
-                    'engine_temp': 95,
-                    'vehicle_speed': 45
-                }
-            }
-        }
+        payload = self._render(self._OBD_PAYLOAD, scan_id)
         
-        topic = f"{MQTT_TOPIC}/obd"
-        self.client.publish(topic, json.dumps(obd_data))
+        topic = OBD_TOPIC
+        self._publish(topic, payload)
         TestLogger.log('INFO', f'Published OBD data to {topic}')
-        return obd_data
+        return payload
     
     def simulate_audio_data(self, scan_id: str):
         """Simulate audio sensor data"""
-        audio_data = {
-            'scan_id': scan_id,
-            'timestamp': datetime.now().isoformat(),
-            'channel': 'audio',
-            'frequencies': [100, 500, 1000, 2000, 4000, 8000],
-            'amplitudes': [45, 62, 58, 41, 35, 28],
-            'peak_frequency': 500,
-            'peak_amplitude': 62,
-            'noise_level': 55,
-            'anomalies': ['bearing_noise', 'exhaust_leak']
-        }
+        payload = self._render(self._AUDIO_PAYLOAD, scan_id)
         
-        topic = f"{MQTT_TOPIC}/audio"
-        self.client.publish(topic, json.dumps(audio_data))
+        topic = AUDIO_TOPIC
+        self._publish(topic, payload)
         TestLogger.log('INFO', f'Published audio data to {topic}')
-        return audio_data
+        return payload
     
     def simulate_thermal_data(self, scan_id: str):
         """Simulate thermal camera data"""
-        thermal_data = {
-            'scan_id': scan_id,
-            'timestamp': datetime.now().isoformat(),
-            'channel': 'thermal',
-            'zones': {
-                'engine': {'temp': 95, 'status': 'normal'},
-                'exhaust': {'temp': 280, 'status': 'normal'},
-                'brakes_front': {'temp': 120, 'status': 'normal'},
-                'brakes_rear': {'temp': 85, 'status': 'normal'},
-                'transmission': {'temp': 75, 'status': 'normal'}
-            },
-            'max_temp': 280,
-            'min_temp': 25,
-            'avg_temp': 115
-        }
+        payload = self._render(self._THERMAL_PAYLOAD, scan_id)
         
-        topic = f"{MQTT_TOPIC}/thermal"
-        self.client.publish(topic, json.dumps(thermal_data))
+        topic = THERMAL_TOPIC
+        self._publish(topic, payload)
         TestLogger.log('INFO', f'Published thermal data to {topic}')
-        return thermal_data
+        return payload
     
     def simulate_tof_data(self, scan_id: str):
         """Simulate Time-of-Flight sensor data"""
-        tof_data = {
-            'scan_id': scan_id,
-            'timestamp': datetime.now().isoformat(),
-            'channel': 'tof',
-            'measurements': {
-                'ground_clearance': 180,
-                'tire_tread_depth': {
-                    'front_left': 7.2,
-                    'front_right': 7.5,
-                    'rear_left': 6.8,
-                    'rear_right': 6.9
-                },
-                'brake_pad_thickness': {
-                    'front_left': 9.5,
-                    'front_right': 9.2,
-                    'rear_left': 8.8,
-                    'rear_right': 8.7
-                }
-            }
-        }
+        payload = self._render(self._TOF_PAYLOAD, scan_id)
         
-        topic = f"{MQTT_TOPIC}/tof"
-        self.client.publish(topic, json.dumps(tof_data))
+        topic = TOF_TOPIC
+        self._publish(topic, payload)
         TestLogger.log('INFO', f'Published TOF data to {topic}')
-        return tof_data
+        return payload
+    
+    def simulate_all(self, scan_id: str):
+        """Publish all four sensor channels back to back
+        
+        paho's publish() only queues the packet for the network thread
+        started by loop_start(), so this never waits on the broker.
+        """
+        return [
+            self.simulate_obd_data(scan_id),
+            self.simulate_audio_data(scan_id),
+            self.simulate_thermal_data(scan_id),
+            self.simulate_tof_data(scan_id)
+        ]
     
     def disconnect(self):
         """Disconnect from MQTT broker"""
+        self.client.loop_stop()
         if self.connected:
-            self.client.loop_stop()
             self.client.disconnect()
             TestLogger.log('INFO', 'Disconnected from MQTT broker')
 
+# One simulator (and MQTT connection) shared by everything in the process
+_mqtt_singleton: Optional[MQTTSimulator] = None
+
+def get_mqtt() -> MQTTSimulator:
+    """Return the shared simulator, starting its connection on first use"""
+    global _mqtt_singleton
+    if _mqtt_singleton is None:
+        _mqtt_singleton = MQTTSimulator()
+        _mqtt_singleton.connect()
+    return _mqtt_singleton
+
+def close_mqtt():
+    """Disconnect and drop the shared simulator"""
+    global _mqtt_singleton
+    if _mqtt_singleton is not None:
+        if _mqtt_singleton.started:
+            _mqtt_singleton.disconnect()
+        _mqtt_singleton = None
+
+class TestSkipped(Exception):
+    """Raised by a test whose preconditions aren't met; not counted"""
+
+def test_case(n_subtests: int = 1, label: str = None):
+    """Count a test's subtests towards the total and fail them on errors
+    
+    Errors that escape the test body are logged and recorded as
+    n_subtests failures; TestSkipped is logged and not counted at all.
+    """
+    def deco(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                result = await fn(self, *args, **kwargs)
+            except TestSkipped as e:
+                TestLogger.log('SKIP', str(e))
+                return None
+            except Exception as e:
+                TestLogger.log('FAIL', f"{label or fn.__name__} error: {e}")
+                SUMMARY.record(failed=n_subtests, total=n_subtests)
+                return None
+            SUMMARY.record(total=n_subtests)
+            return result
+        return wrapper
+    return deco
+
 class ServiceTechnicianTests:
     """Tests from service technician perspective"""
     
@@ -196,217 +421,176 @@ class ServiceTechnicianTests:
         self.session = session
         self.scan_id = None
     
+    async def _get_json(self, url: str, **kwargs):
+        """GET url and return (status, JSON body or None if not 200)"""
+        async with self.session.get(url, **kwargs) as resp:
+            data = await resp.json(loads=_loads) if resp.status == 200 else None
+            return resp.status, data
+    
+    @test_case(2, "Vehicle identification")
     async def test_vehicle_identification(self):
         """Test 1: Vehicle identification via VIN"""
         TestLogger.section("TEST 1: Vehicle Identification")
         
-        try:
-            # Test VIN decoder
-            async with self.session.get(f"{BACKEND_URL}/api/vin/{TEST_VIN}") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    TestLogger.log('PASS', f"VIN decoded: {data.get('make')} {data.get('model')} {data.get('year')}")
-                    test_results['summary']['passed'] += 1
-                else:
-                    TestLogger.log('FAIL', f"VIN decoder failed with status {resp.status}")
-                    test_results['summary']['failed'] += 1
-            
-            # Test vehicle database lookup
-            async with self.session.get(f"{BACKEND_URL}/api/vehicle/database/{TEST_VIN}") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    TestLogger.log('PASS', f"Vehicle database info retrieved")
-                    if data.get('recalls'):
-                        TestLogger.log('INFO', f"Found {len(data['recalls'])} recalls")
-                    test_results['summary']['passed'] += 1
-                else:
-                    TestLogger.log('FAIL', f"Vehicle database lookup failed")
-                    test_results['summary']['failed'] += 1
-                    
-        except Exception as e:
-            TestLogger.log('FAIL', f"Vehicle identification error: {e}")
-            test_results['summary']['failed'] += 1
-        
-        test_results['summary']['total'] += 2
-    
+        # VIN decoder and vehicle database lookups are independent
+        (vin_status, vin_data), (db_status, db_data) = await asyncio.gather(
+            self._get_json(URL_VIN),
+            self._get_json(URL_VEHICLE_DATABASE)
+        )
+        
+        if vin_status == 200:
+            TestLogger.log('PASS', f"VIN decoded: {vin_data.get('make')} {vin_data.get('model')} {vin_data.get('year')}")
+            SUMMARY.record(passed=1)
+        else:
+            TestLogger.log('FAIL', f"VIN decoder failed with status {vin_status}")
+            SUMMARY.record(failed=1)
+        
+        if db_status == 200:
+            TestLogger.log('PASS', f"Vehicle database info retrieved")
+            if db_data.get('recalls'):
+                TestLogger.log('INFO', f"Found {len(db_data['recalls'])} recalls")
+            SUMMARY.record(passed=1)
+        else:
+            TestLogger.log('FAIL', f"Vehicle database lookup failed")
+            SUMMARY.record(failed=1)
+    
+    @test_case(1, "Start scan")
     async def test_start_diagnostic_scan(self):
         """Test 2: Start diagnostic scan"""
         TestLogger.section("TEST 2: Start Diagnostic Scan")
         
-        try:
-            payload = {'vehicle_id': TEST_VIN}
-            async with self.session.post(f"{BACKEND_URL}/api/scan/start", json=payload) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    self.scan_id = data.get('scan_id')
-                    TestLogger.log('PASS', f"Scan started with ID: {self.scan_id}")
-                    test_results['summary']['passed'] += 1
-                    return self.scan_id
-                else:
-                    TestLogger.log('FAIL', f"Failed to start scan: {resp.status}")
-                    test_results['summary']['failed'] += 1
-                    return None
-        except Exception as e:
-            TestLogger.log('FAIL', f"Start scan error: {e}")
-            test_results['summary']['failed'] += 1
-            return None
-        finally:
-            test_results['summary']['total'] += 1
-    
+        payload = {'vehicle_id': TEST_VIN}
+        async with self.session.post(URL_SCAN_START, json=payload) as resp:
+            if resp.status == 200:
+                data = await resp.json(loads=_loads)
+                self.scan_id = data.get('scan_id')
+                TestLogger.log('PASS', f"Scan started with ID: {self.scan_id}")
+                SUMMARY.record(passed=1)
+                return self.scan_id
+            else:
+                TestLogger.log('FAIL', f"Failed to start scan: {resp.status}")
+                SUMMARY.record(failed=1)
+                return None
+    
+    @test_case(1, "OBD auto-detect")
     async def test_obd_autodetect(self):
         """Test 3: OBD Auto-detection"""
         TestLogger.section("TEST 3: OBD Auto-Detection")
         
-        try:
-            async with self.session.get(f"{BACKEND_URL}/api/obd/auto-detect") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    TestLogger.log('PASS', f"OBD auto-detection successful")
-                    TestLogger.log('INFO', f"Detected: {data.get('make')} {data.get('model')}")
-                    test_results['summary']['passed'] += 1
-                else:
-                    TestLogger.log('WARN', f"OBD auto-detection returned {resp.status}")
-                    test_results['summary']['failed'] += 1
-        except Exception as e:
-            TestLogger.log('FAIL', f"OBD auto-detect error: {e}")
-            test_results['summary']['failed'] += 1
-        
-        test_results['summary']['total'] += 1
-    
+        async with self.session.get(URL_OBD_AUTODETECT) as resp:
+            if resp.status == 200:
+                data = await resp.json(loads=_loads)
+                TestLogger.log('PASS', f"OBD auto-detection successful")
+                TestLogger.log('INFO', f"Detected: {data.get('make')} {data.get('model')}")
+                SUMMARY.record(passed=1)
+            else:
+                TestLogger.log('WARN', f"OBD auto-detection returned {resp.status}")
+                SUMMARY.record(failed=1)
+    
+    @test_case(2, "Sensor data collection")
     async def test_sensor_data_collection(self, mqtt_sim: MQTTSimulator):
         """Test 4: Sensor data collection via MQTT"""
         TestLogger.section("TEST 4: Sensor Data Collection")
         
         if not self.scan_id:
-            TestLogger.log('SKIP', "No scan ID available")
-            return
-        
-        try:
-            # Simulate all sensor data
-            mqtt_sim.simulate_obd_data(self.scan_id)
-            await asyncio.sleep(0.5)
-            
-            mqtt_sim.simulate_audio_data(self.scan_id)
-            await asyncio.sleep(0.5)
-            
-            mqtt_sim.simulate_thermal_data(self.scan_id)
-            await asyncio.sleep(0.5)
-            
-            mqtt_sim.simulate_tof_data(self.scan_id)
-            await asyncio.sleep(0.5)
-            
-            TestLogger.log('PASS', "All sensor data published via MQTT")
-            test_results['summary']['passed'] += 1
-            
-            # Verify data received by backend
-            async with self.session.get(f"{BACKEND_URL}/api/latest") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    channels = data.get('data', {}).keys()
-                    TestLogger.log('INFO', f"Backend received channels: {list(channels)}")
-                    test_results['summary']['passed'] += 1
-                else:
-                    TestLogger.log('WARN', "Could not verify MQTT data reception")
-                    test_results['summary']['failed'] += 1
-                    
-        except Exception as e:
-            TestLogger.log('FAIL', f"Sensor data collection error: {e}")
-            test_results['summary']['failed'] += 2
-        
-        test_results['summary']['total'] += 2
-    
+            raise TestSkipped("No scan ID available")
+        
+        # Simulate all sensor data; QoS 0 publishes need no spacing
+        mqtt_sim.simulate_all(self.scan_id)
+        
+        TestLogger.log('PASS', "All sensor data published via MQTT")
+        SUMMARY.record(passed=1)
+        
+        # Verify data received by backend, polling until all channels arrive
+        for _ in range(10):
+            status, data = await self._get_json(URL_LATEST)
+            if status != 200 or len(data.get('data', {})) >= 4:
+                break
+            await asyncio.sleep(0.1)
+        
+        if status == 200:
+            channels = data.get('data', {}).keys()
+            TestLogger.log('INFO', f"Backend received channels: {list(channels)}")
+            SUMMARY.record(passed=1)
+        else:
+            TestLogger.log('WARN', "Could not verify MQTT data reception")
+            SUMMARY.record(failed=1)
+    
+    @test_case(1, "Stop scan")
     async def test_stop_scan(self):
         """Test 5: Stop diagnostic scan"""
         TestLogger.section("TEST 5: Stop Diagnostic Scan")
         
         if not self.scan_id:
-            TestLogger.log('SKIP', "No scan ID available")
-            return
+            raise TestSkipped("No scan ID available")
         
-        try:
-            async with self.session.post(f"{BACKEND_URL}/api/scan/{self.scan_id}/stop") as resp:
-                if resp.status == 200:
-                    TestLogger.log('PASS', f"Scan {self.scan_id} stopped successfully")
-                    test_results['summary']['passed'] += 1
-                else:
-                    TestLogger.log('FAIL', f"Failed to stop scan: {resp.status}")
-                    test_results['summary']['failed'] += 1
-        except Exception as e:
-            TestLogger.log('FAIL', f"Stop scan error: {e}")
-            test_results['summary']['failed'] += 1
-        
-        test_results['summary']['total'] += 1
+        async with self.session.post(f"{URL_SCAN}{self.scan_id}/stop") as resp:
+            if resp.status == 200:
+                TestLogger.log('PASS', f"Scan {self.scan_id} stopped successfully")
+                SUMMARY.record(passed=1)
+            else:
+                TestLogger.log('FAIL', f"Failed to stop scan: {resp.status}")
+                SUMMARY.record(failed=1)
     
+    @test_case(1, "Report generation")
     async def test_report_generation(self):
         """Test 6: Generate diagnostic report"""
         TestLogger.section("TEST 6: Report Generation")
         
-        try:
-            report_data = {
-                'vin': TEST_VIN,
-                'vehicle_info': {
-                    'make': 'Honda',
-                    'model': 'Accord',
-                    'year': 2021,
-                    'mileage': 45000
-                },
-                'parameters': {
-                    'rpm': 2500,
-                    'coolant_temp': 92,
-                    'oil_pressure': 45,
-                    'fuel_pressure': 380
-                },
-                'fault_codes': ['P0301', 'P0171'],
-                'scan_type': 'comprehensive'
-            }
-            
-            async with self.session.post(f"{BACKEND_URL}/api/report/generate", json=report_data) as resp:
-                if resp.status == 200:
-                    report = await resp.json()
-                    TestLogger.log('PASS', "Diagnostic report generated")
-                    TestLogger.log('INFO', f"Overall health: {report.get('health_scores', {}).get('overall', 0)}%")
-                    TestLogger.log('INFO', f"Recommendations: {len(report.get('recommendations', []))}")
-                    test_results['summary']['passed'] += 1
-                    return report
-                else:
-                    TestLogger.log('FAIL', f"Report generation failed: {resp.status}")
-                    test_results['summary']['failed'] += 1
-                    return None
-        except Exception as e:
-            TestLogger.log('FAIL', f"Report generation error: {e}")
-            test_results['summary']['failed'] += 1
-            return None
-        finally:
-            test_results['summary']['total'] += 1
+        report_data = {
+            'vin': TEST_VIN,
+            'vehicle_info': {
+                'make': 'Honda',
+                'model': 'Accord',
+                'year': 2021,
+                'mileage': 45000
+            },
+            'parameters': {
+                'rpm': 2500,
+                'coolant_temp': 92,
+                'oil_pressure': 45,
+                'fuel_pressure': 380
+            },
+            'fault_codes': ['P0301', 'P0171'],
+            'scan_type': 'comprehensive'
+        }
+        
+        async with self.session.post(URL_REPORT_GENERATE, json=report_data) as resp:
+            if resp.status == 200:
+                report = await resp.json(loads=_loads)
+                TestLogger.log('PASS', "Diagnostic report generated")
+                TestLogger.log('INFO', f"Overall health: {report.get('health_scores', {}).get('overall', 0)}%")
+                TestLogger.log('INFO', f"Recommendations: {len(report.get('recommendations', []))}")
+                SUMMARY.record(passed=1)
+                return report
+            else:
+                TestLogger.log('FAIL', f"Report generation failed: {resp.status}")
+                SUMMARY.record(failed=1)
+                return None
 
+    @test_case(1, "Maintenance schedule")
     async def test_maintenance_schedule(self):
         """Test 7: Get maintenance schedule"""
         TestLogger.section("TEST 7: Maintenance Schedule")
         
-        try:
-            params = {
-                'make': 'Honda',
-                'model': 'Accord',
-                'year': 2021,
-                'mileage': 45000
-            }
-            
-            url = f"{BACKEND_URL}/api/vehicle/maintenance"
-            async with self.session.get(url, params=params) as resp:
-                if resp.status == 200:
-                    maintenance = await resp.json()
-                    TestLogger.log('PASS', f"Maintenance schedule retrieved: {len(maintenance)} items")
-                    for item in maintenance[:3]:
-                        TestLogger.log('INFO', f"- {item['service']}: {item['interval_miles']} miles")
-                    test_results['summary']['passed'] += 1
-                else:
-                    TestLogger.log('FAIL', f"Maintenance schedule failed: {resp.status}")
-                    test_results['summary']['failed'] += 1
-        except Exception as e:
-            TestLogger.log('FAIL', f"Maintenance schedule error: {e}")
-            test_results['summary']['failed'] += 1
+        params = {
+            'make': 'Honda',
+            'model': 'Accord',
+            'year': 2021,
+            'mileage': 45000
+        }
         
-        test_results['summary']['total'] += 1
+        url = URL_MAINTENANCE
+        async with self.session.get(url, params=params) as resp:
+            if resp.status == 200:
+                maintenance = await resp.json(loads=_loads)
+                TestLogger.log('PASS', f"Maintenance schedule retrieved: {len(maintenance)} items")
+                for item in maintenance[:3]:
+                    TestLogger.log('INFO', f"- {item['service']}: {item['interval_miles']} miles")
+                SUMMARY.record(passed=1)
+            else:
+                TestLogger.log('FAIL', f"Maintenance schedule failed: {resp.status}")
+                SUMMARY.record(failed=1)
 
 class CustomerPortalTests:
     """Tests from customer perspective"""
@@ -415,24 +599,20 @@ class CustomerPortalTests:
         self.session = session
         self.scan_id = None
     
+    @test_case(1, "Customer portal")
     async def test_customer_portal_access(self):
         """Test 8: Customer portal accessibility"""
         TestLogger.section("TEST 8: Customer Portal Access")
         
-        try:
-            async with self.session.get(CUSTOMER_PORTAL_URL) as resp:
-                if resp.status == 200:
-                    TestLogger.log('PASS', f"Customer portal accessible at {CUSTOMER_PORTAL_URL}")
-                    test_results['summary']['passed'] += 1
-                else:
-                    TestLogger.log('FAIL', f"Customer portal returned {resp.status}")
-                    test_results['summary']['failed'] += 1
-        except Exception as e:
-            TestLogger.log('FAIL', f"Customer portal error: {e}")
-            test_results['summary']['failed'] += 1
-        
-        test_results['summary']['total'] += 1
+        async with self.session.head(CUSTOMER_PORTAL_URL, allow_redirects=True) as resp:
+            if resp.status == 200:
+                TestLogger.log('PASS', f"Customer portal accessible at {CUSTOMER_PORTAL_URL}")
+                SUMMARY.record(passed=1)
+            else:
+                TestLogger.log('FAIL', f"Customer portal returned {resp.status}")
+                SUMMARY.record(failed=1)
     
+    @test_case(1, "Gate simulation")
     async def test_gate_simulation(self):
         """Test 9: Scanning gate simulation"""
         TestLogger.section("TEST 9: Scanning Gate Simulation")
@@ -440,20 +620,24 @@ class CustomerPortalTests:
         try:
             # Simulate vehicle entering gate
             payload = {'action': 'enter', 'vin': TEST_VIN}
-            async with self.session.post(f"{CUSTOMER_PORTAL_URL}/api/gate/enter", json=payload) as resp:
+            async with self.session.post(URL_GATE_ENTER, json=payload) as resp:
                 if resp.status in [200, 404]:  # 404 if endpoint doesn't exist yet
                     TestLogger.log('INFO', "Gate entry simulation attempted")
                     self.scan_id = 'customer-scan-001'
-                    test_results['summary']['passed'] += 1
+                    SUMMARY.record(passed=1)
                 else:
                     TestLogger.log('WARN', f"Gate simulation returned {resp.status}")
-                    test_results['summary']['failed'] += 1
+                    SUMMARY.record(failed=1)
         except Exception as e:
             TestLogger.log('INFO', f"Gate simulation not implemented: {e}")
-            test_results['summary']['passed'] += 1  # Pass if not implemented
-        
-        test_results['summary']['total'] += 1
+            SUMMARY.record(passed=1)  # Pass if not implemented
     
+    async def test_gate_workflow(self):
+        """Tests 9-10: Gate simulation followed by a status check of its scan"""
+        await self.test_gate_simulation()
+        await self.test_scan_status_check()
+    
+    @test_case(1, "Status check")
     async def test_scan_status_check(self):
         """Test 10: Check scan status"""
         TestLogger.section("TEST 10: Scan Status Check")
@@ -461,159 +645,168 @@ class CustomerPortalTests:
         if not self.scan_id:
             self.scan_id = 'test-scan-001'
         
-        try:
-            async with self.session.get(f"{BACKEND_URL}/api/scan/{self.scan_id}/status") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    TestLogger.log('PASS', f"Scan status: {data.get('status')}")
-                    test_results['summary']['passed'] += 1
-                elif resp.status == 404:
-                    TestLogger.log('INFO', "Scan not found (expected for test ID)")
-                    test_results['summary']['passed'] += 1
-                else:
-                    TestLogger.log('FAIL', f"Status check failed: {resp.status}")
-                    test_results['summary']['failed'] += 1
-        except Exception as e:
-            TestLogger.log('FAIL', f"Status check error: {e}")
-            test_results['summary']['failed'] += 1
-        
-        test_results['summary']['total'] += 1
-    
+        async with self.session.get(f"{URL_SCAN}{self.scan_id}/status") as resp:
+            if resp.status == 200:
+                data = await resp.json(loads=_loads)
+                TestLogger.log('PASS', f"Scan status: {data.get('status')}")
+                SUMMARY.record(passed=1)
+            elif resp.status == 404:
+                TestLogger.log('INFO', "Scan not found (expected for test ID)")
+                SUMMARY.record(passed=1)
+            else:
+                TestLogger.log('FAIL', f"Status check failed: {resp.status}")
+                SUMMARY.record(failed=1)
+    
+    @test_case(1, "Common problems")
     async def test_common_problems(self):
         """Test 11: Get common problems for vehicle"""
         TestLogger.section("TEST 11: Common Problems")
         
-        try:
-            params = {
-                'make': 'Honda',
-                'model': 'Accord', 
-                'year': 2021,
-                'mileage': 45000
-            }
-            
-            url = f"{BACKEND_URL}/api/vehicle/common-problems"
-            async with self.session.get(url, params=params) as resp:
-                if resp.status == 200:
-                    problems = await resp.json()
-                    TestLogger.log('PASS', f"Common problems retrieved: {len(problems)} items")
-                    for problem in problems[:3]:
-                        TestLogger.log('INFO', f"- {problem['description']} (Severity: {problem['severity']})")
-                    test_results['summary']['passed'] += 1
-                else:
-                    TestLogger.log('FAIL', f"Common problems failed: {resp.status}")
-                    test_results['summary']['failed'] += 1
-        except Exception as e:
-            TestLogger.log('FAIL', f"Common problems error: {e}")
-            test_results['summary']['failed'] += 1
+        params = {
+            'make': 'Honda',
+            'model': 'Accord', 
+            'year': 2021,
+            'mileage': 45000
+        }
         
-        test_results['summary']['total'] += 1
-    
+        url = URL_COMMON_PROBLEMS
+        async with self.session.get(url, params=params) as resp:
+            if resp.status == 200:
+                problems = await resp.json(loads=_loads)
+                TestLogger.log('PASS', f"Common problems retrieved: {len(problems)} items")
+                for problem in problems[:3]:
+                    TestLogger.log('INFO', f"- {problem['description']} (Severity: {problem['severity']})")
+                SUMMARY.record(passed=1)
+            else:
+                TestLogger.log('FAIL', f"Common problems failed: {resp.status}")
+                SUMMARY.record(failed=1)
+    
+    @test_case(1, "Report download")
     async def test_report_download(self):
         """Test 12: Download PDF report"""
         TestLogger.section("TEST 12: PDF Report Download")
         
         try:
-            # Test report service endpoint
-            async with self.session.get(f"{REPORT_SERVICE_URL}/api/report/test") as resp:
+            # Test report service endpoint; only the status matters, not the PDF body
+            async with self.session.head(URL_REPORT_TEST, allow_redirects=True) as resp:
                 if resp.status in [200, 404]:
                     TestLogger.log('INFO', f"Report service status: {resp.status}")
-                    test_results['summary']['passed'] += 1
+                    SUMMARY.record(passed=1)
                 else:
                     TestLogger.log('FAIL', f"Report service failed: {resp.status}")
-                    test_results['summary']['failed'] += 1
+                    SUMMARY.record(failed=1)
         except Exception as e:
             TestLogger.log('INFO', f"Report service not available: {e}")
-            test_results['summary']['passed'] += 1  # Pass if service not running
-        
-        test_results['summary']['total'] += 1
+            SUMMARY.record(passed=1)  # Pass if service not running
 
 async def run_e2e_tests():
     """Main E2E test runner"""
     
-    print("\n" + "="*60)
+    print("\n" + _BAR)
     print("   MOTOSPECT E2E TEST SUITE")
-    print("="*60)
+    print(_BAR)
     print(f"Test VIN: {TEST_VIN}")
     print(f"Backend URL: {BACKEND_URL}")
     print(f"Customer Portal: {CUSTOMER_PORTAL_URL}")
     print(f"MQTT Broker: {MQTT_HOST}:{MQTT_PORT}")
-    print("="*60)
+    print(_BAR)
     
-    # Initialize MQTT simulator
-    mqtt_sim = MQTTSimulator()
-    mqtt_connected = mqtt_sim.connect()
+    # Initialize MQTT simulator; its handshake overlaps with the HTTP tests
+    mqtt_sim = get_mqtt()
     
-    # Create HTTP session
-    async with aiohttp.ClientSession() as session:
+    # Create HTTP session with a keep-alive pool shared by both workflows
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=32, keepalive_timeout=75, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=30, connect=5)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                     json_serialize=lambda obj: _dumps(obj).decode()) as session:
         # Run service technician tests
-        print("\n" + "="*60)
+        TestLogger.flush()
+        print("\n" + _BAR)
         print("   SERVICE TECHNICIAN WORKFLOW")
-        print("="*60)
+        print(_BAR)
         
         tech_tests = ServiceTechnicianTests(session)
         await tech_tests.test_vehicle_identification()
         scan_id = await tech_tests.test_start_diagnostic_scan()
         await tech_tests.test_obd_autodetect()
         
-        if mqtt_connected:
+        if mqtt_sim.started and await asyncio.to_thread(mqtt_sim.wait_connected):
             await tech_tests.test_sensor_data_collection(mqtt_sim)
         
         await tech_tests.test_stop_scan()
-        report = await tech_tests.test_report_generation()
-        await tech_tests.test_maintenance_schedule()
+        # Report generation and the maintenance lookup don't depend on each other
+        report, _ = await asyncio.gather(
+            TestLogger.grouped(tech_tests.test_report_generation()),
+            TestLogger.grouped(tech_tests.test_maintenance_schedule())
+        )
         
         # Run customer portal tests
-        print("\n" + "="*60)
+        TestLogger.flush()
+        print("\n" + _BAR)
         print("   CUSTOMER PORTAL WORKFLOW")
-        print("="*60)
+        print(_BAR)
         
+        # Customer checks are independent of each other (the gate scan id only
+        # feeds the status check), so overlap their network waits
         customer_tests = CustomerPortalTests(session)
-        await customer_tests.test_customer_portal_access()
-        await customer_tests.test_gate_simulation()
-        await customer_tests.test_scan_status_check()
-        await customer_tests.test_common_problems()
-        await customer_tests.test_report_download()
+        results = await asyncio.gather(
+            TestLogger.grouped(customer_tests.test_customer_portal_access()),
+            TestLogger.grouped(customer_tests.test_gate_workflow()),
+            TestLogger.grouped(customer_tests.test_common_problems()),
+            TestLogger.grouped(customer_tests.test_report_download()),
+            return_exceptions=True
+        )
+        # test_case already records ordinary errors; anything left here escaped it
+        for result in results:
+            if isinstance(result, BaseException):
+                TestLogger.log('FAIL', f"Customer portal test error: {result!r}")
+                SUMMARY.record(failed=1, total=1)
+        TestLogger.flush()
     
     # Cleanup
-    if mqtt_connected:
-        mqtt_sim.disconnect()
+    close_mqtt()
     
     # Generate test report
-    generate_test_report()
+    return await generate_test_report()
+
+def _write_report_bytes(path: str, data: bytes):
+    """Write an encoded report in a single call"""
+    with open(path, 'wb') as f:
+        f.write(data)
 
-def generate_test_report():
+async def generate_test_report():
     """Generate final test report"""
     
-    print("\n" + "="*60)
+    TestLogger.flush()
+    print("\n" + _BAR)
     print("   TEST RESULTS SUMMARY")
-    print("="*60)
+    print(_BAR)
     
-    summary = test_results['summary']
-    pass_rate = (summary['passed'] / summary['total'] * 100) if summary['total'] > 0 else 0
+    test_results['summary'] = asdict(SUMMARY)
+    pass_rate = (SUMMARY.passed / SUMMARY.total * 100) if SUMMARY.total > 0 else 0
     
-    print(f"Total Tests: {summary['total']}")
-    print(f"Passed: {summary['passed']} ✓")
-    print(f"Failed: {summary['failed']} ✗")
+    print(f"Total Tests: {SUMMARY.total}")
+    print(f"Passed: {SUMMARY.passed} ✓")
+    print(f"Failed: {SUMMARY.failed} ✗")
     print(f"Pass Rate: {pass_rate:.1f}%")
     
     # Save detailed report to file
     report_file = f"e2e_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(report_file, 'w') as f:
-        json.dump(test_results, f, indent=2)
+    await asyncio.to_thread(_write_report_bytes, report_file, _dumps_indented(test_results))
     
     print(f"\nDetailed report saved to: {report_file}")
     
     # Print failed tests
-    if summary['failed'] > 0:
+    if SUMMARY.failed > 0:
         print("\nFailed Tests:")
         for test in test_results['tests']:
             if test['level'] == 'FAIL':
                 print(f"  ✗ {test['message']}")
     
-    print("\n" + "="*60)
+    print("\n" + _BAR)
     
     # Return exit code based on results
-    return 0 if summary['failed'] == 0 else 1
+    return 0 if SUMMARY.failed == 0 else 1
 
 if __name__ == "__main__":
     # Run the E2E tests
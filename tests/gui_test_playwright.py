@@ -3,14 +3,39 @@ Comprehensive GUI tests for MOTOSPECT using Playwright
 Tests all frontend components, customer portal, and report service
 """
 import asyncio
-import pytest
-from playwright.async_api import async_playwright, expect
+import aiohttp
+import itertools
+from playwright.async_api import async_playwright, expect, TimeoutError as PlaywrightTimeoutError
 import os
 import json
 import logging
+import multiprocessing
+import queue
+import time
 from datetime import datetime
+from urllib.parse import urlparse
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    # Fall back to the stdlib codec when orjson isn't installed
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
 # Configure logging for tests
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -20,6 +45,8 @@ BASE_URL_FRONTEND = os.getenv("FRONTEND_URL", "http://localhost:3030")
 BASE_URL_CUSTOMER = os.getenv("CUSTOMER_PORTAL_URL", "http://localhost:3040")
 BASE_URL_REPORT = os.getenv("REPORT_SERVICE_URL", "http://localhost:3050")
 BASE_URL_BACKEND = os.getenv("BACKEND_URL", "http://localhost:8030")
+# Socket the frontend opens on load (config.wsUrl in frontend/src/config.js)
+WS_URL = os.getenv("REACT_APP_BACKEND_WS_URL", "ws://localhost:8030/ws")
 
 # Test VINs
 TEST_VINS = [
@@ -28,142 +55,327 @@ TEST_VINS = [
     "WBA3B5C50DF123456",  # BMW 3 Series
 ]
 
+# Playwright driver shared by every suite instance in this process
+_playwright = None
+
+
+async def get_playwright():
+    """Return the shared Playwright driver, starting it on first use"""
+    global _playwright
+    if _playwright is None:
+        _playwright = await async_playwright().start()
+    return _playwright
+
+
+async def close_playwright():
+    """Stop and drop the shared Playwright driver"""
+    global _playwright
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+# Headless CI flags: skip GPU, extensions and background work to cut launch
+# time and memory per browser
+CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--no-first-run',
+    '--no-default-browser-check',
+]
+
+# Image requests aborted on the shared frontend page, whose tests only
+# inspect markup and the canvas
+IMAGE_PATTERN = "**/*.{png,jpg,jpeg,gif,webp}"
+
+# Canned backend responses for UI-wiring tests, matched by path prefix
+CANNED_RESPONSES = {
+    "/health": {"status": "healthy"},
+    "/api/scan/start": {"scan_id": "stub-scan", "status": "started"},
+    "/api/scan/stop/": {"status": "stopped"},
+}
+
+# Breakpoints checked by the responsive test
+VIEWPORTS = [
+    (375, 812, "mobile"),
+    (768, 1024, "tablet"),
+    (1920, 1080, "desktop"),
+]
+
+
+def _write_bytes(path: str, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)
+
 
 class MotospectGUITests:
     """Comprehensive GUI test suite for MOTOSPECT"""
     
-    def __init__(self):
+    # Browser-free probes, run together over the suite's HTTP session
+    API_TESTS = (
+        "test_backend_api_health",
+        "test_backend_api_vin_decode",
+    )
+    
+    # Read-only frontend checks, run in this order on one loaded page
+    SHARED_FRONTEND_TESTS = (
+        "test_frontend_homepage",
+        "test_frontend_3d_interaction",
+        "test_websocket_connection",
+        "test_accessibility_basics",
+    )
+    
+    # Tests that get their own page in a pooled context
+    TEST_METHODS = (
+        "test_frontend_scan_start",
+        "test_customer_portal_homepage",
+        "test_customer_portal_vehicle_lookup",
+        "test_mobile_responsive",
+        "test_invalid_vin_handling",
+    )
+    
+    # Timed tests, each run alone in a fresh context after the pooled batch
+    # so they measure page load rather than contention with other tests
+    SERIAL_TESTS = (
+        "test_page_load_performance",
+    )
+    
+    ALL_TESTS = API_TESTS + SHARED_FRONTEND_TESTS + TEST_METHODS + SERIAL_TESTS
+    
+    # Shared selectors, so every test targets the same elements
+    HEADING_SEL = "h1"
+    PORTAL_HEADING_SEL = "h1, h2"
+    CANVAS_SEL = "canvas"
+    CONTROL_PANEL_SEL = "[data-testid='control-panel'], .control-panel, #controls"
+    VIN_INPUT_SEL = "input[placeholder*='VIN'], input#vin, [data-testid='vin-input']"
+    PORTAL_VIN_INPUT_SEL = "input[placeholder*='VIN'], input#vin"
+    SCAN_BUTTON_SEL = "button:has-text('Start'), button:has-text('Scan'), [data-testid='start-scan']"
+    SCANNING_INDICATOR_SEL = "text=/Scanning|Processing|Analyzing/i"
+    SCAN_DATA_SEL = "[data-testid='scan-data'], .scan-results, .data-display"
+    PORTAL_SUBMIT_SEL = "button:has-text('Submit'), button:has-text('Check')"
+    VEHICLE_INFO_SEL = ".vehicle-info, [data-testid='vehicle-info']"
+    MOBILE_MENU_SEL = ".mobile-menu, [data-testid='mobile-menu']"
+    ERROR_MESSAGE_SEL = ".error, .alert-danger, [role='alert']"
+    
+    def __init__(self, concurrency: Optional[int] = None):
         self.browser = None
-        self.context = None
-        self.page = None
+        self.http = None
+        self.contexts = []
+        # WebSockets opened by the shared frontend page
+        self.frontend_sockets = []
+        # Number of isolated browser contexts tests are spread across
+        self.concurrency = concurrency or int(os.getenv("GUI_TEST_CONCURRENCY", "4"))
         self.test_results = {
             "passed": 0,
             "failed": 0,
             "errors": [],
             "screenshots": []
         }
+        self._pending_screenshots = []
+        self._run_stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._shot_counter = itertools.count()
+        self._results_fp = None
     
-    async def setup(self):
-        """Setup browser and context"""
+    async def setup(self, browser: bool = True):
+        """Setup browser
+        
+        browser=False only opens the HTTP session, enough for API_TESTS.
+        """
+        os.makedirs("screenshots", exist_ok=True)
+        # Per-test results are appended as they finish, so a crash mid-suite
+        # still leaves a record of everything that ran
+        self._results_fp = open(f"test-results-{self._run_stamp}.jsonl", "ab")
+        self.http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30)
+        )
+        if not browser:
+            return
         logger.info("Setting up Playwright browser...")
-        playwright = await async_playwright().start()
+        playwright = await get_playwright()
         self.browser = await playwright.chromium.launch(
             headless=os.getenv("HEADLESS", "true").lower() == "true",
-            args=['--no-sandbox', '--disable-setuid-sandbox']
+            chromium_sandbox=False,
+            args=CHROMIUM_ARGS
         )
-        self.context = await self.browser.new_context(
+    
+    async def new_context(self):
+        """Create an isolated browser context with the suite's settings"""
+        return await self.browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             ignore_https_errors=True,
             record_video_dir="test-videos/" if os.getenv("RECORD_VIDEO") else None
         )
-        self.page = await self.context.new_page()
+    
+    async def new_page(self, ctx):
+        """Open a page in ctx with console logging enabled"""
+        page = await ctx.new_page()
+        page.on("console", lambda msg: logger.debug(f"Browser console: {msg.text}"))
+        page.on("pageerror", lambda err: logger.error(f"Page error: {err}"))
+        return page
+    
+    async def stub_backend(self, page):
+        """Answer the page's backend API calls with CANNED_RESPONSES"""
+        async def fulfill(route):
+            path = urlparse(route.request.url).path
+            body = next((v for k, v in CANNED_RESPONSES.items() if path.startswith(k)), {})
+            await route.fulfill(status=200, content_type="application/json", body=_dumps(body))
         
-        # Enable console logging
-        self.page.on("console", lambda msg: logger.debug(f"Browser console: {msg.text}"))
-        self.page.on("pageerror", lambda err: logger.error(f"Page error: {err}"))
+        await page.route(f"{BASE_URL_BACKEND}/**", fulfill)
+    
+    async def frontend_page(self, ctx):
+        """Open the frontend once with stubbed backend calls for the shared tests"""
+        page = await self.new_page(ctx)
+        # Registered before navigating so the socket opened on mount is seen
+        page.on("websocket", self.frontend_sockets.append)
+        await self.stub_backend(page)
+        await page.route(IMAGE_PATTERN, lambda route: route.abort())
+        await self.open(page, BASE_URL_FRONTEND)
+        return page
+    
+    async def open(self, page, url: str, ready_selector: str = HEADING_SEL):
+        """Navigate to url and wait until ready_selector has rendered"""
+        await page.goto(url, wait_until="domcontentloaded")
+        await expect(page.locator(ready_selector).first).to_be_visible(timeout=5000)
     
     async def teardown(self):
         """Clean up browser resources"""
-        if self.context:
-            await self.context.close()
+        await self.flush_screenshots()
+        for ctx in self.contexts:
+            await ctx.close()
+        self.contexts = []
         if self.browser:
             await self.browser.close()
+            self.browser = None
+        if self.http:
+            await self.http.close()
+            self.http = None
+        if self._results_fp:
+            self._results_fp.close()
+            self._results_fp = None
+    
+    def record_result(self, test_name: str, error: Optional[Exception] = None):
+        """Count a test outcome and append it to the JSONL results log"""
+        if error is None:
+            self.test_results["passed"] += 1
+        else:
+            self.test_results["failed"] += 1
+            self.test_results["errors"].append(f"{test_name}: {str(error)}")
+        if self._results_fp:
+            record = {"test": test_name, "passed": error is None, "error": str(error) if error else None}
+            self._results_fp.write(_dumps(record) + b"\n")
+            self._results_fp.flush()
+    
+    async def flush_screenshots(self):
+        """Wait for background screenshot writes to finish"""
+        pending, self._pending_screenshots = self._pending_screenshots, []
+        results = await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+        for (filename, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                # Only report screenshots that actually made it to disk
+                logger.warning(f"Screenshot failed: {result}")
+                self.test_results["screenshots"].remove(filename)
     
-    async def take_screenshot(self, name: str):
+    async def take_screenshot(self, page, name: str):
         """Take a screenshot for debugging"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"screenshots/{name}_{timestamp}.png"
-        os.makedirs("screenshots", exist_ok=True)
-        await self.page.screenshot(path=filename)
+        # Run stamp plus counter keeps names unique within the same second
+        filename = f"screenshots/{name}_{self._run_stamp}_{next(self._shot_counter)}.png"
+        # Capture now (the page may close right after), write to disk in the
+        # background; teardown waits for pending writes
+        png = await page.screenshot()
+        self._pending_screenshots.append(
+            (filename, asyncio.create_task(asyncio.to_thread(_write_bytes, filename, png)))
+        )
         self.test_results["screenshots"].append(filename)
         logger.info(f"Screenshot saved: {filename}")
     
-    async def log_network_errors(self):
+    async def log_network_errors(self, page):
         """Log any network errors"""
         def handle_response(response):
             if response.status >= 400:
                 logger.warning(f"Network error: {response.status} - {response.url}")
         
-        self.page.on("response", handle_response)
+        page.on("response", handle_response)
     
     # --- Frontend Tests ---
     
-    async def test_frontend_homepage(self):
+    async def test_frontend_homepage(self, page):
         """Test frontend homepage loads correctly"""
         test_name = "frontend_homepage"
         try:
             logger.info(f"Running test: {test_name}")
-            await self.page.goto(BASE_URL_FRONTEND, wait_until="networkidle")
             
             # Check title
-            await expect(self.page).to_have_title("MOTOSPECT - Vehicle Diagnostic System", timeout=5000)
+            # The title is in the static <head>, so it is set once the DOM has loaded
+            assert await page.title() == "MOTOSPECT - Vehicle Diagnostic System", "Unexpected page title"
             
             # Check main components exist
-            await expect(self.page.locator("h1")).to_contain_text("MOTOSPECT")
+            await expect(page.locator(self.HEADING_SEL)).to_contain_text("MOTOSPECT")
             
             # Check 3D visualization canvas exists
-            canvas = self.page.locator("canvas")
+            canvas = page.locator(self.CANVAS_SEL)
             await expect(canvas).to_be_visible()
             
             # Check control panel exists
-            control_panel = self.page.locator("[data-testid='control-panel'], .control-panel, #controls")
+            control_panel = page.locator(self.CONTROL_PANEL_SEL)
             await expect(control_panel).to_be_visible()
             
-            await self.take_screenshot(test_name)
-            self.test_results["passed"] += 1
+            await self.take_screenshot(page, test_name)
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
-            await self.take_screenshot(f"{test_name}_error")
+            self.record_result(test_name, e)
+            await self.take_screenshot(page, f"{test_name}_error")
             logger.error(f"✗ Test {test_name} failed: {e}")
     
-    async def test_frontend_scan_start(self):
+    async def test_frontend_scan_start(self, ctx):
         """Test starting a scan from frontend"""
         test_name = "frontend_scan_start"
+        page = await self.new_page(ctx)
         try:
             logger.info(f"Running test: {test_name}")
-            await self.page.goto(BASE_URL_FRONTEND, wait_until="networkidle")
+            await self.open(page, BASE_URL_FRONTEND)
             
             # Enter VIN
-            vin_input = self.page.locator("input[placeholder*='VIN'], input#vin, [data-testid='vin-input']")
+            vin_input = page.locator(self.VIN_INPUT_SEL)
             await vin_input.fill(TEST_VINS[0])
             
             # Click scan button
-            scan_button = self.page.locator("button:has-text('Start'), button:has-text('Scan'), [data-testid='start-scan']")
+            scan_button = page.locator(self.SCAN_BUTTON_SEL)
             await scan_button.click()
             
             # Wait for scanning indicator
-            scanning_indicator = self.page.locator("text=/Scanning|Processing|Analyzing/i")
+            scanning_indicator = page.locator(self.SCANNING_INDICATOR_SEL)
             await expect(scanning_indicator).to_be_visible(timeout=10000)
             
-            # Check WebSocket connection
-            await self.page.wait_for_timeout(2000)
+            # Wait for data updates to arrive over the WebSocket
+            data_display = page.locator(self.SCAN_DATA_SEL)
+            await expect(data_display).to_be_visible(timeout=10000)
             
-            # Check for data updates
-            data_display = self.page.locator("[data-testid='scan-data'], .scan-results, .data-display")
-            await expect(data_display).to_be_visible()
-            
-            await self.take_screenshot(test_name)
-            self.test_results["passed"] += 1
+            await self.take_screenshot(page, test_name)
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
-            await self.take_screenshot(f"{test_name}_error")
+            self.record_result(test_name, e)
+            await self.take_screenshot(page, f"{test_name}_error")
             logger.error(f"✗ Test {test_name} failed: {e}")
+        finally:
+            await page.close()
     
-    async def test_frontend_3d_interaction(self):
+    async def test_frontend_3d_interaction(self, page):
         """Test 3D visualization interactions"""
         test_name = "frontend_3d_interaction"
         try:
             logger.info(f"Running test: {test_name}")
-            await self.page.goto(BASE_URL_FRONTEND, wait_until="networkidle")
             
             # Get canvas element
-            canvas = self.page.locator("canvas")
+            canvas = page.locator(self.CANVAS_SEL)
             await expect(canvas).to_be_visible()
             
             # Test mouse interactions (pan, zoom, rotate)
@@ -173,87 +385,87 @@ class MotospectGUITests:
                 center_y = box['y'] + box['height'] / 2
                 
                 # Rotate
-                await self.page.mouse.move(center_x, center_y)
-                await self.page.mouse.down()
-                await self.page.mouse.move(center_x + 100, center_y)
-                await self.page.mouse.up()
+                await page.mouse.move(center_x, center_y)
+                await page.mouse.down()
+                await page.mouse.move(center_x + 100, center_y)
+                await page.mouse.up()
                 
                 # Zoom
-                await self.page.mouse.wheel(0, -100)
-                await self.page.wait_for_timeout(500)
-                await self.page.mouse.wheel(0, 100)
+                await page.mouse.wheel(0, -100)
+                await page.wait_for_timeout(500)
+                await page.mouse.wheel(0, 100)
             
-            await self.take_screenshot(test_name)
-            self.test_results["passed"] += 1
+            await self.take_screenshot(page, test_name)
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
-            await self.take_screenshot(f"{test_name}_error")
+            self.record_result(test_name, e)
+            await self.take_screenshot(page, f"{test_name}_error")
             logger.error(f"✗ Test {test_name} failed: {e}")
     
     # --- Customer Portal Tests ---
     
-    async def test_customer_portal_homepage(self):
+    async def test_customer_portal_homepage(self, ctx):
         """Test customer portal homepage"""
         test_name = "customer_portal_homepage"
+        page = await self.new_page(ctx)
         try:
             logger.info(f"Running test: {test_name}")
-            await self.page.goto(BASE_URL_CUSTOMER, wait_until="networkidle")
+            await self.open(page, BASE_URL_CUSTOMER, self.PORTAL_HEADING_SEL)
             
             # Check main elements
-            await expect(self.page.locator("h1, h2")).to_contain_text("Customer Portal")
+            await expect(page.locator(self.PORTAL_HEADING_SEL)).to_contain_text("Customer Portal")
             
             # Check VIN input exists
-            vin_input = self.page.locator("input[placeholder*='VIN'], input#vin")
+            vin_input = page.locator(self.PORTAL_VIN_INPUT_SEL)
             await expect(vin_input).to_be_visible()
             
             # Check submit button
-            submit_button = self.page.locator("button:has-text('Submit'), button:has-text('Check')")
+            submit_button = page.locator(self.PORTAL_SUBMIT_SEL)
             await expect(submit_button).to_be_visible()
             
-            await self.take_screenshot(test_name)
-            self.test_results["passed"] += 1
+            await self.take_screenshot(page, test_name)
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
-            await self.take_screenshot(f"{test_name}_error")
+            self.record_result(test_name, e)
+            await self.take_screenshot(page, f"{test_name}_error")
             logger.error(f"✗ Test {test_name} failed: {e}")
+        finally:
+            await page.close()
     
-    async def test_customer_portal_vehicle_lookup(self):
+    async def test_customer_portal_vehicle_lookup(self, ctx):
         """Test vehicle lookup in customer portal"""
         test_name = "customer_portal_vehicle_lookup"
+        page = await self.new_page(ctx)
         try:
             logger.info(f"Running test: {test_name}")
-            await self.page.goto(BASE_URL_CUSTOMER, wait_until="networkidle")
+            await self.open(page, BASE_URL_CUSTOMER, self.PORTAL_HEADING_SEL)
             
             # Enter VIN
-            vin_input = self.page.locator("input[placeholder*='VIN'], input#vin")
+            vin_input = page.locator(self.PORTAL_VIN_INPUT_SEL)
             await vin_input.fill(TEST_VINS[1])
             
             # Submit
-            submit_button = self.page.locator("button:has-text('Submit'), button:has-text('Check')")
+            submit_button = page.locator(self.PORTAL_SUBMIT_SEL)
             await submit_button.click()
             
-            # Wait for results
-            await self.page.wait_for_timeout(2000)
-            
-            # Check for vehicle info display
-            vehicle_info = self.page.locator(".vehicle-info, [data-testid='vehicle-info']")
+            # Wait for vehicle info display
+            vehicle_info = page.locator(self.VEHICLE_INFO_SEL)
             await expect(vehicle_info).to_be_visible(timeout=10000)
             
-            await self.take_screenshot(test_name)
-            self.test_results["passed"] += 1
+            await self.take_screenshot(page, test_name)
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
-            await self.take_screenshot(f"{test_name}_error")
+            self.record_result(test_name, e)
+            await self.take_screenshot(page, f"{test_name}_error")
             logger.error(f"✗ Test {test_name} failed: {e}")
+        finally:
+            await page.close()
     
     # --- API Integration Tests ---
     
@@ -263,18 +475,17 @@ class MotospectGUITests:
         try:
             logger.info(f"Running test: {test_name}")
             
-            response = await self.page.request.get(f"{BASE_URL_BACKEND}/health")
-            assert response.ok, f"Health check failed with status {response.status}"
+            async with self.http.get(f"{BASE_URL_BACKEND}/health") as response:
+                assert response.status == 200, f"Health check failed with status {response.status}"
+                data = await response.json(loads=_loads)
             
-            data = await response.json()
             assert data.get("status") == "healthy", "Backend not healthy"
             
-            self.test_results["passed"] += 1
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
+            self.record_result(test_name, e)
             logger.error(f"✗ Test {test_name} failed: {e}")
     
     async def test_backend_api_vin_decode(self):
@@ -283,223 +494,252 @@ class MotospectGUITests:
         try:
             logger.info(f"Running test: {test_name}")
             
-            response = await self.page.request.post(
+            async with self.http.post(
                 f"{BASE_URL_BACKEND}/api/vehicle/decode",
-                data={"vin": TEST_VINS[0]}
-            )
+                json={"vin": TEST_VINS[0]}
+            ) as response:
+                assert response.status == 200, f"VIN decode failed with status {response.status}"
+                data = await response.json(loads=_loads)
             
-            assert response.ok, f"VIN decode failed with status {response.status}"
-            
-            data = await response.json()
             assert "make" in data, "Make not in response"
             assert "model" in data, "Model not in response"
             
-            self.test_results["passed"] += 1
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
+            self.record_result(test_name, e)
             logger.error(f"✗ Test {test_name} failed: {e}")
     
     # --- WebSocket Tests ---
     
-    async def test_websocket_connection(self):
+    async def test_websocket_connection(self, page):
         """Test WebSocket connection and data flow"""
         test_name = "websocket_connection"
         try:
             logger.info(f"Running test: {test_name}")
             
-            # Navigate to frontend
-            await self.page.goto(BASE_URL_FRONTEND, wait_until="networkidle")
-            
-            # Check for WebSocket connection
-            ws_connected = await self.page.evaluate("""
-                () => {
-                    return window.ws && window.ws.readyState === WebSocket.OPEN;
-                }
-            """)
-            
-            # If not connected via global, check for any WS connections
-            if not ws_connected:
-                await self.page.wait_for_timeout(2000)
-                # Try to detect WS through network activity
-                
-            self.test_results["passed"] += 1
+            # The app keeps its socket private, so check what the page opened
+            sockets = [ws for ws in self.frontend_sockets if ws.url == WS_URL]
+            if not sockets:
+                try:
+                    sockets = [await page.wait_for_event(
+                        "websocket", predicate=lambda ws: ws.url == WS_URL, timeout=5000
+                    )]
+                except PlaywrightTimeoutError:
+                    raise AssertionError(f"Frontend never opened a WebSocket to {WS_URL}")
+            assert any(not ws.is_closed() for ws in sockets), f"WebSocket to {WS_URL} closed"
+            
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
+            self.record_result(test_name, e)
             logger.error(f"✗ Test {test_name} failed: {e}")
     
     # --- Responsive Design Tests ---
     
-    async def test_mobile_responsive(self):
+    async def test_mobile_responsive(self, ctx):
         """Test mobile responsiveness"""
         test_name = "mobile_responsive"
+        page = await self.new_page(ctx)
         try:
             logger.info(f"Running test: {test_name}")
+            await self.stub_backend(page)
             
-            # Set mobile viewport
-            await self.page.set_viewport_size({"width": 375, "height": 812})
-            await self.page.goto(BASE_URL_FRONTEND, wait_until="networkidle")
-            
-            # Check elements are visible
-            await expect(self.page.locator("h1")).to_be_visible()
+            # Load once at mobile size, then resize in place; the layout
+            # reacts to viewport changes without a reload
+            await page.set_viewport_size({"width": 375, "height": 812})
+            await self.open(page, BASE_URL_FRONTEND)
             
-            # Check for mobile menu if present
-            mobile_menu = self.page.locator(".mobile-menu, [data-testid='mobile-menu']")
-            if await mobile_menu.count() > 0:
-                await expect(mobile_menu).to_be_visible()
-            
-            await self.take_screenshot(f"{test_name}_mobile")
-            
-            # Test tablet view
-            await self.page.set_viewport_size({"width": 768, "height": 1024})
-            await self.page.reload()
-            await self.take_screenshot(f"{test_name}_tablet")
+            # Mobile menu is optional, but if rendered it must be visible;
+            # checked in one query instead of count() plus expect()
+            menu_ok = await page.locator(self.MOBILE_MENU_SEL).evaluate_all(
+                "els => els.length === 0 || els.some(e => e.checkVisibility())"
+            )
+            assert menu_ok, "Mobile menu present but not visible"
             
-            # Reset to desktop
-            await self.page.set_viewport_size({"width": 1920, "height": 1080})
+            for width, height, label in VIEWPORTS:
+                await page.set_viewport_size({"width": width, "height": height})
+                await expect(page.locator(self.HEADING_SEL)).to_be_visible()
+                await self.take_screenshot(page, f"{test_name}_{label}")
             
-            self.test_results["passed"] += 1
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
-            await self.take_screenshot(f"{test_name}_error")
+            self.record_result(test_name, e)
+            await self.take_screenshot(page, f"{test_name}_error")
             logger.error(f"✗ Test {test_name} failed: {e}")
+        finally:
+            await page.close()
     
     # --- Performance Tests ---
     
-    async def test_page_load_performance(self):
+    async def test_page_load_performance(self, ctx):
         """Test page load performance"""
         test_name = "page_load_performance"
+        page = await self.new_page(ctx)
         try:
             logger.info(f"Running test: {test_name}")
             
-            # Measure frontend load time
-            start_time = asyncio.get_event_loop().time()
-            await self.page.goto(BASE_URL_FRONTEND, wait_until="networkidle")
-            frontend_load_time = asyncio.get_event_loop().time() - start_time
+            # Measure time until content is rendered, not until the network is idle
+            start_time = time.perf_counter()
+            await self.open(page, BASE_URL_FRONTEND)
+            frontend_load_time = time.perf_counter() - start_time
             
             assert frontend_load_time < 5, f"Frontend load time too slow: {frontend_load_time:.2f}s"
             logger.info(f"Frontend load time: {frontend_load_time:.2f}s")
             
             # Measure customer portal load time
-            start_time = asyncio.get_event_loop().time()
-            await self.page.goto(BASE_URL_CUSTOMER, wait_until="networkidle")
-            portal_load_time = asyncio.get_event_loop().time() - start_time
+            start_time = time.perf_counter()
+            await self.open(page, BASE_URL_CUSTOMER, self.PORTAL_HEADING_SEL)
+            portal_load_time = time.perf_counter() - start_time
             
             assert portal_load_time < 5, f"Portal load time too slow: {portal_load_time:.2f}s"
             logger.info(f"Portal load time: {portal_load_time:.2f}s")
             
-            self.test_results["passed"] += 1
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
+            self.record_result(test_name, e)
             logger.error(f"✗ Test {test_name} failed: {e}")
+        finally:
+            await page.close()
     
     # --- Error Handling Tests ---
     
-    async def test_invalid_vin_handling(self):
+    async def test_invalid_vin_handling(self, ctx):
         """Test handling of invalid VIN"""
         test_name = "invalid_vin_handling"
+        page = await self.new_page(ctx)
         try:
             logger.info(f"Running test: {test_name}")
-            await self.page.goto(BASE_URL_FRONTEND, wait_until="networkidle")
+            await self.open(page, BASE_URL_FRONTEND)
             
             # Enter invalid VIN
-            vin_input = self.page.locator("input[placeholder*='VIN'], input#vin")
+            vin_input = page.locator(self.VIN_INPUT_SEL)
             await vin_input.fill("INVALID123")
             
             # Try to start scan
-            scan_button = self.page.locator("button:has-text('Start'), button:has-text('Scan')")
+            scan_button = page.locator(self.SCAN_BUTTON_SEL)
             await scan_button.click()
             
             # Check for error message
-            error_message = self.page.locator(".error, .alert-danger, [role='alert']")
+            error_message = page.locator(self.ERROR_MESSAGE_SEL)
             await expect(error_message).to_be_visible(timeout=5000)
             
-            await self.take_screenshot(test_name)
-            self.test_results["passed"] += 1
+            await self.take_screenshot(page, test_name)
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
-            await self.take_screenshot(f"{test_name}_error")
+            self.record_result(test_name, e)
+            await self.take_screenshot(page, f"{test_name}_error")
             logger.error(f"✗ Test {test_name} failed: {e}")
+        finally:
+            await page.close()
     
     # --- Accessibility Tests ---
     
-    async def test_accessibility_basics(self):
+    async def test_accessibility_basics(self, page):
         """Test basic accessibility features"""
         test_name = "accessibility_basics"
         try:
             logger.info(f"Running test: {test_name}")
-            await self.page.goto(BASE_URL_FRONTEND, wait_until="networkidle")
             
-            # Check for alt text on images
-            images = await self.page.locator("img").all()
-            for img in images:
-                alt_text = await img.get_attribute("alt")
-                assert alt_text, "Image missing alt text"
+            # Collect image alt text and heading checks in one round trip
+            result = await page.evaluate("""() => ({
+                missingAlt: [...document.images].some(i => !i.getAttribute('alt')),
+                h1Count: document.querySelectorAll('h1').length,
+            })""")
+            assert not result["missingAlt"], "Image missing alt text"
             
             # Check for proper heading hierarchy
-            h1_count = await self.page.locator("h1").count()
-            assert h1_count >= 1, "Page should have at least one H1"
+            assert result["h1Count"] >= 1, "Page should have at least one H1"
             
             # Check for keyboard navigation
-            await self.page.keyboard.press("Tab")
-            focused_element = await self.page.evaluate("() => document.activeElement.tagName")
+            await page.keyboard.press("Tab")
+            focused_element = await page.evaluate("() => document.activeElement.tagName")
             assert focused_element != "BODY", "Tab navigation not working"
             
-            self.test_results["passed"] += 1
+            self.record_result(test_name)
             logger.info(f"✓ Test {test_name} passed")
             
         except Exception as e:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {str(e)}")
+            self.record_result(test_name, e)
             logger.error(f"✗ Test {test_name} failed: {e}")
     
     # --- Run all tests ---
     
-    async def run_all_tests(self):
-        """Run all GUI tests"""
+    async def run_all_tests(self, names: Optional[list] = None, report: bool = True):
+        """Run all GUI tests, or only the named ones"""
         logger.info("="*60)
         logger.info("Starting MOTOSPECT GUI Test Suite")
         logger.info("="*60)
         
-        test_methods = [
-            self.test_frontend_homepage,
-            self.test_frontend_scan_start,
-            self.test_frontend_3d_interaction,
-            self.test_customer_portal_homepage,
-            self.test_customer_portal_vehicle_lookup,
-            self.test_backend_api_health,
-            self.test_backend_api_vin_decode,
-            self.test_websocket_connection,
-            self.test_mobile_responsive,
-            self.test_page_load_performance,
-            self.test_invalid_vin_handling,
-            self.test_accessibility_basics,
-        ]
+        names = names or self.ALL_TESTS
+        api_names = [name for name in names if name in self.API_TESTS]
+        shared_names = [name for name in self.SHARED_FRONTEND_TESTS if name in names]
+        test_methods = [getattr(self, name) for name in names if name in self.TEST_METHODS]
+        serial_names = [name for name in self.SERIAL_TESTS if name in names]
+        units = len(test_methods) + (1 if shared_names else 0)
+        self.contexts = [await self.new_context() for _ in range(min(self.concurrency, units))]
+        
+        # Each test borrows a context from the pool for its whole run, so
+        # tests never share cookies or storage while running concurrently
+        pool = asyncio.Queue()
+        for ctx in self.contexts:
+            pool.put_nowait(ctx)
         
-        for test_method in test_methods:
+        pooled = [self._run_pooled(test_method, pool) for test_method in test_methods]
+        if shared_names:
+            pooled.append(self._run_pooled(self._run_shared_frontend, pool, shared_names))
+        
+        await asyncio.gather(self._run_api_probes(api_names), *pooled)
+        
+        for name in serial_names:
+            ctx = await self.new_context()
             try:
-                await test_method()
-            except Exception as e:
-                logger.error(f"Test method {test_method.__name__} crashed: {e}")
-                self.test_results["failed"] += 1
-                self.test_results["errors"].append(f"{test_method.__name__}: {str(e)}")
+                await getattr(self, name)(ctx)
+            finally:
+                await ctx.close()
         
-        # Generate report
-        self.generate_report()
+        # Generate report once every screenshot it lists has been written
+        if report:
+            await self.flush_screenshots()
+            return self.generate_report()
+    
+    async def _run_api_probes(self, names):
+        """Run the API tests concurrently over the pooled HTTP session"""
+        await asyncio.gather(*(getattr(self, name)() for name in names))
+    
+    async def _run_shared_frontend(self, ctx, names):
+        """Run read-only frontend tests one after another on a single loaded page"""
+        try:
+            page = await self.frontend_page(ctx)
+        except Exception as e:
+            # Without the page none of the shared tests can run
+            for name in names:
+                self.record_result(name[len("test_"):], e)
+            return
+        try:
+            for name in names:
+                await getattr(self, name)(page)
+        finally:
+            await page.close()
+    
+    async def _run_pooled(self, test_method, pool: asyncio.Queue, *args):
+        """Run test_method on a context borrowed from pool"""
+        ctx = await pool.get()
+        try:
+            await test_method(ctx, *args)
+        except Exception as e:
+            logger.error(f"Test method {test_method.__name__} crashed: {e}")
+            self.record_result(test_method.__name__, e)
+        finally:
+            pool.put_nowait(ctx)
     
     def generate_report(self):
         """Generate test report"""
@@ -519,9 +759,9 @@ class MotospectGUITests:
             logger.info(f"\nScreenshots saved: {len(self.test_results['screenshots'])}")
         
         # Save report to file
-        report_file = f"test-report-{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(self.test_results, f, indent=2)
+        report_file = f"test-report-{self._run_stamp}.json"
+        with open(report_file, 'wb') as f:
+            f.write(_dumps_indented(self.test_results))
         logger.info(f"\nDetailed report saved to: {report_file}")
         
         # Return exit code
@@ -533,11 +773,87 @@ async def main():
     tester = MotospectGUITests()
     try:
         await tester.setup()
-        await tester.run_all_tests()
+        return await tester.run_all_tests()
     finally:
         await tester.teardown()
+        await close_playwright()
+
+
+def _worker(index: int, names: list, results: multiprocessing.Queue):
+    """Run a subset of tests with their own browser and send back the results"""
+    async def run():
+        tester = MotospectGUITests()
+        try:
+            await tester.setup()
+            await tester.run_all_tests(names, report=False)
+        finally:
+            await tester.teardown()
+            await close_playwright()
+        return tester.test_results
+    
+    try:
+        results.put((index, asyncio.run(run())))
+    except Exception as e:
+        # Count the whole subset as failed; hard crashes are caught by the parent
+        results.put((index, _failed_bucket(names, str(e))))
+
+
+def _failed_bucket(names: list, reason: str) -> Dict[str, Any]:
+    """Results for a worker whose tests could not report back"""
+    return {"passed": 0, "failed": len(names), "errors": [f"worker {names}: {reason}"], "screenshots": []}
+
+
+def run_in_processes(workers: int) -> int:
+    """Split the suite across worker processes and merge their results"""
+    names = list(MotospectGUITests.ALL_TESTS)
+    buckets = [names[i::workers] for i in range(workers) if names[i::workers]]
+    
+    mp = multiprocessing.get_context("spawn")
+    results = mp.Queue()
+    procs = [mp.Process(target=_worker, args=(i, bucket, results)) for i, bucket in enumerate(buckets)]
+    for proc in procs:
+        proc.start()
+    
+    merged = MotospectGUITests()
+    
+    def merge(partial: Dict[str, Any]):
+        for key in ("passed", "failed"):
+            merged.test_results[key] += partial[key]
+        for key in ("errors", "screenshots"):
+            merged.test_results[key].extend(partial[key])
+    
+    pending = set(range(len(procs)))
+    while pending:
+        try:
+            index, partial = results.get(timeout=1.0)
+        except queue.Empty:
+            # A worker that died without reporting (segfault, OOM kill) would
+            # otherwise leave get() blocked forever
+            dead = [i for i in pending if not procs[i].is_alive()]
+            # Results a worker wrote just before exiting are already in the pipe
+            while True:
+                try:
+                    index, partial = results.get_nowait()
+                except queue.Empty:
+                    break
+                pending.discard(index)
+                merge(partial)
+            for i in dead:
+                if i in pending:
+                    pending.discard(i)
+                    merge(_failed_bucket(buckets[i], f"exited with code {procs[i].exitcode} before reporting"))
+            continue
+        pending.discard(index)
+        merge(partial)
+    for proc in procs:
+        proc.join()
+    
+    return merged.generate_report()
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    # GUI_TEST_WORKERS > 1 fans the suite out over that many processes,
+    # each with its own browser
+    workers = int(os.getenv("GUI_TEST_WORKERS", "1"))
+    exit_code = run_in_processes(workers) if workers > 1 else asyncio.run(main())
     exit(exit_code)
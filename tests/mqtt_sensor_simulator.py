@@ -4,288 +4,766 @@ MQTT Sensor Simulator for MotoSpect
 Simulates all sensor channels: OBD, Audio, Thermal, TOF
 """
 
+import os
 import json
 import time
+import socket
 import random
 import argparse
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import paho.mqtt.client as mqtt
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+def _json_default(obj):
+    """Encode values the stdlib JSON codec can't handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_json(obj) -> bytes:
+    return json.dumps(obj, default=_json_default).encode()
+
+
+try:
+    import orjson
+
+    def _encode_orjson(obj) -> bytes:
+        # orjson serializes datetime and numpy values natively
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    _encode_orjson = None
+
+try:
+    import msgpack
+
+    def _encode_msgpack(obj) -> bytes:
+        return msgpack.packb(obj, use_bin_type=True, default=_json_default)
+except ImportError:
+    _encode_msgpack = None
+
+try:
+    from numpy.random import Generator, SFC64
+except ImportError:
+    # numpy isn't installed (or the repo's offline stub is shadowing it)
+    Generator = None
+
+# Integer draws for generate_obd_data, high bound exclusive: rpm offset,
+# engine temp, oil pressure, fuel pressure, throttle, intake temp, fuel level,
+# fault code count, freeze frame rpm jitter
+_OBD_INT_LOW = (0, 0, 0, 0, 0, 0, 10, 1, -200)
+_OBD_INT_HIGH = (3201, 41, 31, 81, 101, 41, 101, 4, 201)
+# Floats: battery voltage, MAF rate, O2 voltage, fault code roll
+_OBD_FLOATS = 4
+
+# Audio: seven amplitude offsets, noise offset, anomaly count; one float for
+# the anomaly roll
+_AUDIO_INT_LOW = (-10,) * 7 + (0, 1)
+_AUDIO_INT_HIGH = (21,) * 7 + (16, 3)
+_AUDIO_FLOATS = 1
+
+# TOF: ground clearance, then suspension offsets per wheel; eight floats for
+# tire tread and brake pad wear
+_TOF_INT_LOW = (0, -20, -20, -20, -20)
+_TOF_INT_HIGH = (51, 21, 21, 21, 21)
+_TOF_FLOATS = 8
+
+# Fault codes and audio anomalies the generators pick from
+_FAULT_CODES = ('P0301', 'P0171', 'P0420', 'P0442', 'B1234', 'C0035')
+_AUDIO_ANOMALIES = ('bearing_noise', 'exhaust_leak', 'belt_squeal', 'knocking')
+
+# Audio spectrum bands (Hz) the amplitudes are reported for
+_FREQUENCIES = (100, 250, 500, 1000, 2000, 4000, 8000)
+
+# Thermal zones with their temperature ranges (high bound exclusive) and
+# the temperature above which a zone is reported as a hotspot
+_ZONE_NAMES = ('engine', 'exhaust', 'brakes_front', 'brakes_rear', 'transmission')
+_THERMAL_LOW = (85, 250, 80, 60, 60)
+_THERMAL_HIGH = (116, 351, 161, 121, 91)
+_THERMAL_THRESHOLDS = (105, 320, 140, 120, 85)
+
+_CHANNELS = ('obd', 'audio', 'thermal', 'tof')
+
+# Every channel's bounds back to back, so _generate_all draws a whole cycle
+# in one integers() and one random() call and slices it per channel
+_ALL_INT_LOW = _OBD_INT_LOW + _AUDIO_INT_LOW + _THERMAL_LOW + _TOF_INT_LOW
+_ALL_INT_HIGH = _OBD_INT_HIGH + _AUDIO_INT_HIGH + _THERMAL_HIGH + _TOF_INT_HIGH
+_ALL_FLOATS = _OBD_FLOATS + _AUDIO_FLOATS + _TOF_FLOATS
+
+# --format fast: full channel payloads have a fixed shape, so their static
+# scaffolding is rendered once into byte templates and each publish only
+# %-formats the values in. Variable-length fields (fault codes, anomalies,
+# hotspots) and payloads without a fixed shape (deltas, bundles) still go
+# through the regular JSON encoder.
+_encode_dynamic = _encode_orjson or _encode_json
+
+_WHEELS = ('front_left', 'front_right', 'rear_left', 'rear_right')
+
+
+def _slots(keys) -> bytes:
+    return b','.join(b'"%s":%%a' % key.encode() for key in keys)
+
+
+_FAST_HEADER = b'{"scan_id":%s,"timestamp":"%s","channel":'
+_FAST_OBD = _FAST_HEADER + b'"obd","vin":%s,"parameters":{' + _slots((
+    'rpm', 'engine_temp', 'oil_pressure', 'fuel_pressure', 'battery_voltage', 'throttle_position',
+    'maf_rate', 'o2_voltage', 'vehicle_speed', 'intake_temp', 'fuel_level',
+)) + b'},"fault_codes":%s,"freeze_frame":%s}'
+_FAST_AUDIO = (
+    _FAST_HEADER + b'"audio","frequencies":[' + b','.join(b'%d' % f for f in _FREQUENCIES)
+    + b'],"amplitudes":[' + b','.join([b'%a'] * len(_FREQUENCIES))
+    + b'],"peak_frequency":%a,"peak_amplitude":%a,"noise_level":%a,"anomalies":%s}'
+)
+_FAST_THERMAL = (
+    _FAST_HEADER + b'"thermal","zones":{'
+    + b','.join(b'"%s":{"temp":%%a,"status":"%%s"}' % zone.encode() for zone in _ZONE_NAMES)
+    + b'},"max_temp":%a,"min_temp":%a,"avg_temp":%a,"hotspots":%s}'
+)
+_FAST_TOF = (
+    _FAST_HEADER + b'"tof","measurements":{"ground_clearance":%a,'
+    + b','.join(b'"%s":{%s}' % (name, _slots(_WHEELS))
+                for name in (b'tire_tread_depth', b'brake_pad_thickness', b'suspension_height'))
+    + b'}}'
+)
+
+
+def _fast_obd(data) -> bytes:
+    p = data['parameters']
+    return _FAST_OBD % (
+        _encode_dynamic(data['scan_id']), data['timestamp'].isoformat().encode(),
+        _encode_dynamic(data['vin']),
+        p['rpm'], p['engine_temp'], p['oil_pressure'], p['fuel_pressure'], p['battery_voltage'],
+        p['throttle_position'], p['maf_rate'], p['o2_voltage'], p['vehicle_speed'],
+        p['intake_temp'], p['fuel_level'],
+        _encode_dynamic(data['fault_codes']), _encode_dynamic(data['freeze_frame']),
+    )
+
+
+def _fast_audio(data) -> bytes:
+    return _FAST_AUDIO % (
+        _encode_dynamic(data['scan_id']), data['timestamp'].isoformat().encode(),
+        *data['amplitudes'],
+        data['peak_frequency'], data['peak_amplitude'], data['noise_level'],
+        _encode_dynamic(data['anomalies']),
+    )
+
+
+def _fast_thermal(data) -> bytes:
+    zones = data['zones']
+    values = []
+    for zone in _ZONE_NAMES:
+        values += (zones[zone]['temp'], zones[zone]['status'].encode())
+    return _FAST_THERMAL % (
+        _encode_dynamic(data['scan_id']), data['timestamp'].isoformat().encode(),
+        *values,
+        data['max_temp'], data['min_temp'], data['avg_temp'],
+        _encode_dynamic(data['hotspots']),
+    )
+
+
+def _fast_tof(data) -> bytes:
+    m = data['measurements']
+    tread, pads, height = m['tire_tread_depth'], m['brake_pad_thickness'], m['suspension_height']
+    return _FAST_TOF % (
+        _encode_dynamic(data['scan_id']), data['timestamp'].isoformat().encode(),
+        m['ground_clearance'],
+        *(tread[w] for w in _WHEELS), *(pads[w] for w in _WHEELS), *(height[w] for w in _WHEELS),
+    )
+
+
+_FAST_ENCODERS = {
+    'obd': _fast_obd,
+    'audio': _fast_audio,
+    'thermal': _fast_thermal,
+    'tof': _fast_tof,
+}
+
+
+def _encode_fast(obj) -> bytes:
+    fast = None if 'delta' in obj else _FAST_ENCODERS.get(obj.get('channel'))
+    return fast(obj) if fast else _encode_dynamic(obj)
+
+
+# Payload encoders selectable with --format; None when the package is missing
+ENCODERS = {
+    'json': _encode_json,
+    'orjson': _encode_orjson,
+    'msgpack': _encode_msgpack,
+    'fast': _encode_fast,
+}
+DEFAULT_FORMAT = 'orjson' if _encode_orjson else 'json'
+
+
+
+# Fields every delta message carries in full
+_DELTA_HEADER = ('scan_id', 'timestamp', 'channel')
+
+
+def _diff(prev: Dict[str, Any], cur: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields of cur that differ from prev, as a nested merge patch
+    
+    Applying the result means merging nested dicts into the previous
+    payload, replacing other values, and deleting keys whose value is None
+    (payloads never carry None themselves).
+    """
+    out = {}
+    for key, value in cur.items():
+        old = prev.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            sub = _diff(old, value)
+            if sub:
+                out[key] = sub
+        elif value != old:
+            out[key] = value
+    for key in prev.keys() - cur.keys():
+        out[key] = None
+    return out
+
+
+class _Rng:
+    """Batched random draws: one numpy call per batch, stdlib random otherwise
+    
+    The numpy generator runs on SFC64, the cheapest of numpy's bit
+    generators per draw. A seed makes runs reproducible.
+    """
+    
+    def __init__(self, seed=None):
+        self._np = Generator(SFC64(seed)) if Generator else None
+        self._py = random.Random(seed)
+    
+    def integers(self, low, high) -> list:
+        """One int per (low, high) pair, high exclusive"""
+        if self._np is not None:
+            return self._np.integers(low, high).tolist()
+        return [self._py.randrange(lo, hi) for lo, hi in zip(low, high)]
+    
+    def choice(self, n: int, k: int) -> list:
+        """k distinct indices from range(n)"""
+        if self._np is not None:
+            return self._np.choice(n, size=k, replace=False).tolist()
+        return self._py.sample(range(n), k)
+    
+    def random(self, n: int) -> list:
+        """n floats in [0, 1)"""
+        if self._np is not None:
+            return self._np.random(n).tolist()
+        return [self._py.random() for _ in range(n)]
 
 class SensorSimulator:
     """Simulates vehicle sensor data over MQTT"""
     
-    def __init__(self, broker_host='localhost', broker_port=1883, base_topic='motospect/v1'):
+    # One paho client per (host, port), shared by every simulator in the
+    # process and reference-counted so only the last disconnect() closes it
+    _pool: Dict[tuple, Dict[str, Any]] = {}
+    _pool_lock = threading.Lock()
+    
+    # Per-channel payload scaffolding: static fields are filled in once and
+    # generators copy the template, so every payload shares the key layout
+    # and only the dynamic fields are assigned per call
+    _AUDIO_TEMPLATE = {
+        'scan_id': None,
+        'timestamp': None,
+        'channel': 'audio',
+        'frequencies': list(_FREQUENCIES),
+        'amplitudes': None,
+        'peak_frequency': None,
+        'peak_amplitude': None,
+        'noise_level': None,
+        'anomalies': None,
+    }
+    _THERMAL_TEMPLATE = {
+        'scan_id': None,
+        'timestamp': None,
+        'channel': 'thermal',
+        'zones': None,
+        'max_temp': None,
+        'min_temp': None,
+        'avg_temp': None,
+        'hotspots': None,
+    }
+    _TOF_TEMPLATE = {
+        'scan_id': None,
+        'timestamp': None,
+        'channel': 'tof',
+        'measurements': None,
+    }
+    
+    def __init__(self, broker_host='localhost', broker_port=1883, base_topic='motospect/v1',
+                 payload_format=DEFAULT_FORMAT, batch=False, qos=0, keyframe_interval=0, seed=None):
         self.broker_host = broker_host
         self.broker_port = broker_port
         self.base_topic = base_topic
-        self.client = mqtt.Client(client_id=f"sensor-simulator-{random.randint(1000, 9999)}")
-        self.connected = False
         self.test_vin = '1HGBH41JXMN109186'
+        self._rng = _Rng(seed)
+        self._obd_template = {
+            'scan_id': None,
+            'timestamp': None,
+            'channel': 'obd',
+            'vin': self.test_vin,
+            'parameters': None,
+            'fault_codes': None,
+            'freeze_frame': None,
+        }
+        # Publish all channels as one message on <base_topic>/bundle
+        self.batch = batch
+        # Continuous runs send a full payload every keyframe_interval cycles
+        # and only changed fields in between; 0 always sends full payloads
+        self.keyframe_interval = keyframe_interval
+        self._last_payload = {}
+        # Telemetry is loss-tolerant, so default to fire-and-forget QoS 0
+        self.qos = qos
+        
+        # Resolve the encoder once instead of branching on every publish
+        self._encode = ENCODERS[payload_format]
+        if self._encode is None:
+            raise ValueError(f"'{payload_format}' format requires the {payload_format} package")
+        # Binary payloads go to a separate topic so JSON subscribers aren't fed msgpack
+        suffix = '/msgpack' if payload_format == 'msgpack' else ''
+        # Topics and generators are fixed per simulator, so resolve them once
+        self._topics = {
+            channel: f"{base_topic}/{channel}{suffix}"
+            for channel in _CHANNELS + ('bundle',)
+        }
+        self._generators = {
+            'obd': self.generate_obd_data,
+            'audio': self.generate_audio_data,
+            'thermal': self.generate_thermal_data,
+            'tof': self.generate_tof_data,
+        }
+        
+        # Simulators pointed at the same broker share one client and session
+        self.client = self.get_or_create_client(broker_host, broker_port)
+        self._conn = self._pool[(broker_host, broker_port)]
+        # Set once this simulator has dropped its reference to the pooled client
+        self._released = False
         
-        # Setup callbacks
-        self.client.on_connect = self._on_connect
-        self.client.on_disconnect = self._on_disconnect
+    @classmethod
+    def get_or_create_client(cls, host: str, port: int) -> mqtt.Client:
+        """Return the pooled client for host:port, creating it on first use
         
-    def _on_connect(self, client, userdata, flags, rc):
+        Every call takes a reference that disconnect() gives back; the
+        client is only torn down when the last simulator releases it.
+        """
+        key = (host, port)
+        with cls._pool_lock:
+            conn = cls._pool.get(key)
+            if conn is None:
+                conn = {
+                    'host': host,
+                    'port': port,
+                    'refs': 0,
+                    'started': False,
+                    'connected': threading.Event(),
+                }
+                # A stable client_id with clean_session=False lets the broker
+                # resume the session after a reconnect instead of rebuilding it
+                client = mqtt.Client(
+                    client_id=f"sensor-simulator-{socket.gethostname()}-{os.getpid()}",
+                    clean_session=False,
+                    userdata=conn,
+                )
+                # Let bursts queue up instead of blocking on the in-flight window
+                client.max_inflight_messages_set(100)
+                client.max_queued_messages_set(10000)
+                client.on_connect = cls._on_connect
+                client.on_disconnect = cls._on_disconnect
+                # paho's network thread reconnects on its own after a drop
+                client.reconnect_delay_set(min_delay=1, max_delay=30)
+                conn['client'] = client
+                cls._pool[key] = conn
+            conn['refs'] += 1
+            return conn['client']
+    
+    @property
+    def connected(self) -> bool:
+        return self._conn['connected'].is_set()
+    
+    @staticmethod
+    def _on_connect(client, userdata, flags, rc):
         """Callback for MQTT connection"""
         if rc == 0:
-            print(f"✓ Connected to MQTT broker at {self.broker_host}:{self.broker_port}")
-            self.connected = True
+            print(f"✓ Connected to MQTT broker at {userdata['host']}:{userdata['port']}")
+            userdata['connected'].set()
         else:
             print(f"✗ Connection failed with code {rc}")
-            self.connected = False
+            userdata['connected'].clear()
     
-    def _on_disconnect(self, client, userdata, rc):
+    @staticmethod
+    def _on_disconnect(client, userdata, rc):
         """Callback for MQTT disconnection"""
         print(f"Disconnected from broker (code: {rc})")
-        self.connected = False
+        userdata['connected'].clear()
     
     def connect(self):
-        """Connect to MQTT broker"""
+        """Connect to MQTT broker
+        
+        Only the first simulator on a pooled client opens the connection;
+        the rest just wait for it to come up.
+        """
         try:
-            self.client.connect(self.broker_host, self.broker_port, 60)
-            self.client.loop_start()
-            time.sleep(1)  # Wait for connection
+            with self._pool_lock:
+                start = not self._conn['started']
+                self._conn['started'] = True
+            if start:
+                self.client.connect(self.broker_host, self.broker_port, 60)
+                self.client.loop_start()
+            # Return as soon as the broker acknowledges the connection
+            self._conn['connected'].wait(timeout=5)
             return self.connected
         except Exception as e:
+            with self._pool_lock:
+                self._conn['started'] = False
             print(f"✗ Connection error: {e}")
             return False
     
-    def generate_obd_data(self, scan_id: str) -> Dict[str, Any]:
-        """Generate realistic OBD sensor data"""
+    def _build_obd(self, scan_id: str, ts: datetime, ints: list, floats: list) -> Dict[str, Any]:
+        """OBD payload from pre-drawn _OBD_INT_* ints and _OBD_FLOATS floats"""
         # Simulate engine running conditions
-        rpm = 800 + random.randint(0, 3200)
+        rpm_offset, engine_temp, oil, fuel, throttle, intake, fuel_level, num_codes, jitter = ints
+        battery, maf, o2, fault_roll = floats
+        rpm = 800 + rpm_offset
         speed = min(120, rpm * 0.03)  # Rough speed calculation
         
-        data = {
-            'scan_id': scan_id,
-            'timestamp': datetime.now().isoformat(),
-            'channel': 'obd',
-            'vin': self.test_vin,
-            'parameters': {
-                'rpm': rpm,
-                'engine_temp': 75 + random.randint(0, 40),  # 75-115°C
-                'oil_pressure': 30 + random.randint(0, 30),  # 30-60 PSI
-                'fuel_pressure': 350 + random.randint(0, 80),  # 350-430 kPa
-                'battery_voltage': 13.5 + random.random() * 1.5,  # 13.5-15V
-                'throttle_position': random.randint(0, 100),  # 0-100%
-                'maf_rate': 5 + random.random() * 20,  # 5-25 g/s
-                'o2_voltage': 0.1 + random.random() * 0.8,  # 0.1-0.9V
-                'vehicle_speed': speed,
-                'intake_temp': 20 + random.randint(0, 40),  # 20-60°C
-                'fuel_level': random.randint(10, 100),  # 10-100%
-            },
-            'fault_codes': [],
-            'freeze_frame': {}
+        data = self._obd_template.copy()
+        data['scan_id'] = scan_id
+        data['timestamp'] = ts
+        data['parameters'] = {
+            'rpm': rpm,
+            'engine_temp': 75 + engine_temp,  # 75-115°C
+            'oil_pressure': 30 + oil,  # 30-60 PSI
+            'fuel_pressure': 350 + fuel,  # 350-430 kPa
+            'battery_voltage': 13.5 + battery * 1.5,  # 13.5-15V
+            'throttle_position': throttle,  # 0-100%
+            'maf_rate': 5 + maf * 20,  # 5-25 g/s
+            'o2_voltage': 0.1 + o2 * 0.8,  # 0.1-0.9V
+            'vehicle_speed': speed,
+            'intake_temp': 20 + intake,  # 20-60°C
+            'fuel_level': fuel_level,  # 10-100%
         }
+        data['fault_codes'] = []
+        data['freeze_frame'] = {}
         
         # Randomly add fault codes
-        if random.random() > 0.7:
-            codes = ['P0301', 'P0171', 'P0420', 'P0442', 'B1234', 'C0035']
-            num_codes = random.randint(1, 3)
-            data['fault_codes'] = random.sample(codes, num_codes)
+        if fault_roll > 0.7:
+            data['fault_codes'] = [_FAULT_CODES[i] for i in self._rng.choice(len(_FAULT_CODES), num_codes)]
             
             # Add freeze frame data for first code
             if data['fault_codes']:
                 data['freeze_frame'][data['fault_codes'][0]] = {
-                    'rpm': rpm + random.randint(-200, 200),
+                    'rpm': rpm + jitter,
                     'engine_temp': data['parameters']['engine_temp'],
                     'vehicle_speed': speed
                 }
         
         return data
     
-    def generate_audio_data(self, scan_id: str) -> Dict[str, Any]:
-        """Generate audio spectrum data"""
-        frequencies = [100, 250, 500, 1000, 2000, 4000, 8000]
+    def _build_audio(self, scan_id: str, ts: datetime, ints: list, floats: list) -> Dict[str, Any]:
+        """Audio payload from pre-drawn _AUDIO_INT_* ints and _AUDIO_FLOATS floats"""
         base_amplitude = 40
         
-        # Generate frequency amplitudes with some variation
-        amplitudes = [
-            base_amplitude + random.randint(-10, 20) for _ in frequencies
-        ]
+        # Frequency amplitudes with some variation
+        amplitudes = [base_amplitude + offset for offset in ints[:7]]
+        noise, num_anomalies = ints[7:]
         
-        # Find peak
-        peak_idx = amplitudes.index(max(amplitudes))
-        
-        data = {
-            'scan_id': scan_id,
-            'timestamp': datetime.now().isoformat(),
-            'channel': 'audio',
-            'frequencies': frequencies,
-            'amplitudes': amplitudes,
-            'peak_frequency': frequencies[peak_idx],
-            'peak_amplitude': amplitudes[peak_idx],
-            'noise_level': base_amplitude + random.randint(0, 15),
-            'anomalies': []
-        }
+        # Find peak in a single pass
+        peak_idx = max(range(len(amplitudes)), key=amplitudes.__getitem__)
+        
+        data = self._AUDIO_TEMPLATE.copy()
+        data['scan_id'] = scan_id
+        data['timestamp'] = ts
+        data['amplitudes'] = amplitudes
+        data['peak_frequency'] = _FREQUENCIES[peak_idx]
+        data['peak_amplitude'] = amplitudes[peak_idx]
+        data['noise_level'] = base_amplitude + noise
+        data['anomalies'] = []
         
         # Randomly add anomalies
-        if random.random() > 0.6:
-            anomalies = ['bearing_noise', 'exhaust_leak', 'belt_squeal', 'knocking']
-            data['anomalies'] = random.sample(anomalies, random.randint(1, 2))
+        if floats[0] > 0.6:
+            data['anomalies'] = [_AUDIO_ANOMALIES[i] for i in self._rng.choice(len(_AUDIO_ANOMALIES), num_anomalies)]
         
         return data
     
-    def generate_thermal_data(self, scan_id: str) -> Dict[str, Any]:
-        """Generate thermal camera data"""
-        # Base temperatures for different zones
-        engine_temp = 85 + random.randint(0, 30)
-        exhaust_temp = 250 + random.randint(0, 100)
-        brake_temp_front = 80 + random.randint(0, 80)
-        brake_temp_rear = 60 + random.randint(0, 60)
-        trans_temp = 60 + random.randint(0, 30)
+    def _build_thermal(self, scan_id: str, ts: datetime, temps: list) -> Dict[str, Any]:
+        """Thermal payload from pre-drawn zone temperatures"""
+        high = [t > limit for t, limit in zip(temps, _THERMAL_THRESHOLDS)]
         
         zones = {
-            'engine': {
-                'temp': engine_temp,
-                'status': 'high' if engine_temp > 105 else 'normal'
-            },
-            'exhaust': {
-                'temp': exhaust_temp,
-                'status': 'high' if exhaust_temp > 320 else 'normal'
-            },
-            'brakes_front': {
-                'temp': brake_temp_front,
-                'status': 'high' if brake_temp_front > 140 else 'normal'
-            },
-            'brakes_rear': {
-                'temp': brake_temp_rear,
-                'status': 'high' if brake_temp_rear > 120 else 'normal'
-            },
-            'transmission': {
-                'temp': trans_temp,
-                'status': 'high' if trans_temp > 85 else 'normal'
-            }
-        }
-        
-        temps = [z['temp'] for z in zones.values()]
-        
-        data = {
-            'scan_id': scan_id,
-            'timestamp': datetime.now().isoformat(),
-            'channel': 'thermal',
-            'zones': zones,
-            'max_temp': max(temps),
-            'min_temp': min(temps),
-            'avg_temp': sum(temps) / len(temps),
-            'hotspots': []
+            zone: {'temp': t, 'status': 'high' if is_high else 'normal'}
+            for zone, t, is_high in zip(_ZONE_NAMES, temps, high)
         }
         
-        # Add hotspots if any zone is high
-        for zone, info in zones.items():
-            if info['status'] == 'high':
-                data['hotspots'].append({'zone': zone, 'temp': info['temp']})
+        data = self._THERMAL_TEMPLATE.copy()
+        data['scan_id'] = scan_id
+        data['timestamp'] = ts
+        data['zones'] = zones
+        data['max_temp'] = max(temps)
+        data['min_temp'] = min(temps)
+        data['avg_temp'] = sum(temps) / len(temps)
+        # Hotspots for every zone above its threshold
+        data['hotspots'] = [
+            {'zone': zone, 'temp': t}
+            for zone, t, is_high in zip(_ZONE_NAMES, temps, high) if is_high
+        ]
         
         return data
     
-    def generate_tof_data(self, scan_id: str) -> Dict[str, Any]:
-        """Generate Time-of-Flight sensor data"""
-        data = {
-            'scan_id': scan_id,
-            'timestamp': datetime.now().isoformat(),
-            'channel': 'tof',
-            'measurements': {
-                'ground_clearance': 150 + random.randint(0, 50),  # 150-200mm
-                'tire_tread_depth': {
-                    'front_left': 6 + random.random() * 4,  # 6-10mm
-                    'front_right': 6 + random.random() * 4,
-                    'rear_left': 5 + random.random() * 4,  # 5-9mm
-                    'rear_right': 5 + random.random() * 4
-                },
-                'brake_pad_thickness': {
-                    'front_left': 7 + random.random() * 5,  # 7-12mm
-                    'front_right': 7 + random.random() * 5,
-                    'rear_left': 6 + random.random() * 4,  # 6-10mm
-                    'rear_right': 6 + random.random() * 4
-                },
-                'suspension_height': {
-                    'front_left': 300 + random.randint(-20, 20),
-                    'front_right': 300 + random.randint(-20, 20),
-                    'rear_left': 320 + random.randint(-20, 20),
-                    'rear_right': 320 + random.randint(-20, 20)
-                }
+    def _build_tof(self, scan_id: str, ts: datetime, ints: list, floats: list) -> Dict[str, Any]:
+        """TOF payload from pre-drawn _TOF_INT_* ints and _TOF_FLOATS floats"""
+        clearance, susp_fl, susp_fr, susp_rl, susp_rr = ints
+        tread_fl, tread_fr, tread_rl, tread_rr, pad_fl, pad_fr, pad_rl, pad_rr = floats
+        
+        data = self._TOF_TEMPLATE.copy()
+        data['scan_id'] = scan_id
+        data['timestamp'] = ts
+        data['measurements'] = {
+            'ground_clearance': 150 + clearance,  # 150-200mm
+            'tire_tread_depth': {
+                'front_left': 6 + tread_fl * 4,  # 6-10mm
+                'front_right': 6 + tread_fr * 4,
+                'rear_left': 5 + tread_rl * 4,  # 5-9mm
+                'rear_right': 5 + tread_rr * 4
+            },
+            'brake_pad_thickness': {
+                'front_left': 7 + pad_fl * 5,  # 7-12mm
+                'front_right': 7 + pad_fr * 5,
+                'rear_left': 6 + pad_rl * 4,  # 6-10mm
+                'rear_right': 6 + pad_rr * 4
+            },
+            'suspension_height': {
+                'front_left': 300 + susp_fl,
+                'front_right': 300 + susp_fr,
+                'rear_left': 320 + susp_rl,
+                'rear_right': 320 + susp_rr
             }
         }
         
         return data
     
-    def publish_sensor_data(self, scan_id: str, channels: list = None):
-        """Publish sensor data for specified channels"""
+    def generate_obd_data(self, scan_id: str, ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Generate realistic OBD sensor data"""
+        return self._build_obd(scan_id, ts or datetime.now(),
+                               self._rng.integers(_OBD_INT_LOW, _OBD_INT_HIGH),
+                               self._rng.random(_OBD_FLOATS))
+    
+    def generate_audio_data(self, scan_id: str, ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Generate audio spectrum data"""
+        return self._build_audio(scan_id, ts or datetime.now(),
+                                 self._rng.integers(_AUDIO_INT_LOW, _AUDIO_INT_HIGH),
+                                 self._rng.random(_AUDIO_FLOATS))
+    
+    def generate_thermal_data(self, scan_id: str, ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Generate thermal camera data"""
+        return self._build_thermal(scan_id, ts or datetime.now(),
+                                   self._rng.integers(_THERMAL_LOW, _THERMAL_HIGH))
+    
+    def generate_tof_data(self, scan_id: str, ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Generate Time-of-Flight sensor data"""
+        return self._build_tof(scan_id, ts or datetime.now(),
+                               self._rng.integers(_TOF_INT_LOW, _TOF_INT_HIGH),
+                               self._rng.random(_TOF_FLOATS))
+    
+    def _generate_all(self, scan_id: str, ts: datetime) -> tuple:
+        """All four channels' payloads, in _CHANNELS order, from one draw
+        
+        A full publish cycle draws every int in one integers() call and every
+        float in one random() call, then slices them per channel.
+        """
+        ints = self._rng.integers(_ALL_INT_LOW, _ALL_INT_HIGH)
+        floats = self._rng.random(_ALL_FLOATS)
+        i1 = len(_OBD_INT_LOW)
+        i2 = i1 + len(_AUDIO_INT_LOW)
+        i3 = i2 + len(_THERMAL_LOW)
+        f1 = _OBD_FLOATS
+        f2 = f1 + _AUDIO_FLOATS
+        return (
+            self._build_obd(scan_id, ts, ints[:i1], floats[:f1]),
+            self._build_audio(scan_id, ts, ints[i1:i2], floats[f1:f2]),
+            self._build_thermal(scan_id, ts, ints[i2:i3]),
+            self._build_tof(scan_id, ts, ints[i3:], floats[f2:]),
+        )
+    
+    def _publish(self, topic: str, payload: bytes, label: str, pending: list) -> bool:
+        """Publish one payload and report the outcome"""
+        result = self.client.publish(topic, payload, qos=self.qos)
+        pending.append(result)
+        if result.rc == 0:
+            print(f"✓ Published {label} data to {topic}")
+            return True
+        print(f"✗ Failed to publish {label} data")
+        return False
+    
+    def _delta_payload(self, channel: str, data: Dict[str, Any], keyframe: bool) -> Dict[str, Any]:
+        """Return data, or only what changed since the channel's last payload"""
+        prev = self._last_payload.get(channel)
+        self._last_payload[channel] = data
+        if keyframe or prev is None:
+            return data
+        delta = _diff(prev, data)
+        for key in _DELTA_HEADER:
+            delta.pop(key, None)
+        payload = {key: data[key] for key in _DELTA_HEADER}
+        payload['delta'] = delta
+        return payload
+    
+    def publish_sensor_data(self, scan_id: str, channels: list = None, keyframe: bool = True):
+        """Publish sensor data for specified channels
+        
+        With keyframe=False, channels published before carry only the fields
+        that changed since their last payload, as a 'delta' merge patch.
+        """
         if not self.connected:
             print("✗ Not connected to broker")
             return False
         
-        if channels is None:
-            channels = ['obd', 'audio', 'thermal', 'tof']
-        
         results = {}
+        bundle = {}
+        pending = []
+        # All channels in one call describe the same instant
+        ts = datetime.now()
         
+        # A full cycle (the default) draws every channel in one fused pass
+        fused = {}
+        if channels is None:
+            channels = _CHANNELS
+            try:
+                fused = dict(zip(_CHANNELS, self._generate_all(scan_id, ts)))
+            except Exception as e:
+                print(f"✗ Error generating sensor data: {e}")
+                return dict.fromkeys(_CHANNELS, False)
+        
+        # Publishes go out back-to-back; paho's network thread flushes them
         for channel in channels:
             try:
                 # Generate data based on channel
-                if channel == 'obd':
-                    data = self.generate_obd_data(scan_id)
-                elif channel == 'audio':
-                    data = self.generate_audio_data(scan_id)
-                elif channel == 'thermal':
-                    data = self.generate_thermal_data(scan_id)
-                elif channel == 'tof':
-                    data = self.generate_tof_data(scan_id)
-                else:
-                    print(f"✗ Unknown channel: {channel}")
+                data = fused.get(channel)
+                if data is None:
+                    generate = self._generators.get(channel)
+                    if generate is None:
+                        print(f"✗ Unknown channel: {channel}")
+                        continue
+                    data = generate(scan_id, ts)
+                
+                data = self._delta_payload(channel, data, keyframe)
+                
+                if self.batch:
+                    bundle[channel] = data
                     continue
                 
                 # Publish to MQTT
-                topic = f"{self.base_topic}/{channel}"
-                payload = json.dumps(data)
-                result = self.client.publish(topic, payload, qos=1)
-                
-                if result.rc == 0:
-                    print(f"✓ Published {channel} data to {topic}")
-                    results[channel] = True
-                else:
-                    print(f"✗ Failed to publish {channel} data")
-                    results[channel] = False
-                    
-                time.sleep(0.1)  # Small delay between publishes
+                results[channel] = self._publish(self._topics[channel], self._encode(data), channel, pending)
                 
             except Exception as e:
                 print(f"✗ Error publishing {channel} data: {e}")
                 results[channel] = False
         
+        # Batch mode: all channels in one message, serialized once
+        if bundle:
+            try:
+                ok = self._publish(self._topics['bundle'], self._encode(bundle), '/'.join(bundle), pending)
+            except Exception as e:
+                print(f"✗ Error publishing bundle data: {e}")
+                ok = False
+            results.update(dict.fromkeys(bundle, ok))
+        
+        # With QoS >= 1, wait for the acks once after everything is queued
+        # rather than after each publish
+        if self.qos > 0:
+            for info in pending:
+                if info.rc == 0:
+                    info.wait_for_publish(timeout=5)
+        
         return results
     
+    def _is_keyframe(self, iteration: int) -> bool:
+        """Whether a continuous run's iteration (1-based) sends full payloads"""
+        return not self.keyframe_interval or (iteration - 1) % self.keyframe_interval == 0
+    
     def simulate_continuous(self, scan_id: str, duration: int = 60, interval: int = 5):
         """Continuously simulate sensor data"""
         print(f"\nStarting continuous simulation for {duration} seconds...")
         print(f"Publishing every {interval} seconds")
         print("Press Ctrl+C to stop\n")
         
-        start_time = time.time()
+        # Monotonic clock with absolute deadlines: the cadence doesn't drift by
+        # however long each publish takes and ignores wall-clock jumps
+        start_time = time.monotonic()
+        next_tick = start_time + interval
         iteration = 0
         
         try:
-            while time.time() - start_time < duration:
+            while time.monotonic() - start_time < duration:
                 iteration += 1
                 print(f"\n--- Iteration {iteration} ---")
                 
                 # Publish all sensor data
-                self.publish_sensor_data(scan_id)
+                self.publish_sensor_data(scan_id, keyframe=self._is_keyframe(iteration))
                 
                 # Wait for next iteration
-                time.sleep(interval)
+                sleep_for = next_tick - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                next_tick += interval
                 
         except KeyboardInterrupt:
             print("\n\nSimulation stopped by user")
         
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
+        print(f"\nSimulation complete. Duration: {elapsed:.1f} seconds")
+    
+    async def simulate_continuous_async(self, scan_id: str, duration: float = 60, interval: float = 5):
+        """Continuously simulate sensor data from an asyncio event loop
+        
+        Same cadence as simulate_continuous, but waits with asyncio.sleep so
+        it can run alongside other coroutines, e.g. inside an async test
+        harness. QoS 0 publishes only queue on paho's network thread; with
+        QoS >= 1 the ack wait runs in a worker thread to keep the loop free.
+        """
+        print(f"\nStarting continuous simulation for {duration} seconds...")
+        print(f"Publishing every {interval} seconds")
+        
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        next_tick = start_time + interval
+        iteration = 0
+        
+        while loop.time() - start_time < duration:
+            iteration += 1
+            print(f"\n--- Iteration {iteration} ---")
+            
+            keyframe = self._is_keyframe(iteration)
+            if self.qos > 0:
+                await asyncio.to_thread(self.publish_sensor_data, scan_id, None, keyframe)
+            else:
+                self.publish_sensor_data(scan_id, keyframe=keyframe)
+            
+            await asyncio.sleep(max(0, next_tick - loop.time()))
+            next_tick += interval
+        
+        elapsed = loop.time() - start_time
         print(f"\nSimulation complete. Duration: {elapsed:.1f} seconds")
     
     def disconnect(self):
-        """Disconnect from MQTT broker"""
-        if self.connected:
+        """Disconnect from MQTT broker
+        
+        The connection is kept for the simulator's whole run, across every
+        publish cycle; call this only on exit.
+        """
+        with self._pool_lock:
+            # Safe to call twice; only the first call drops this simulator's reference
+            if self._released:
+                return
+            self._released = True
+            self._conn['refs'] -= 1
+            if self._conn['refs'] > 0:
+                return
+            key = (self.broker_host, self.broker_port)
+            if self._pool.get(key) is self._conn:
+                del self._pool[key]
+            started = self._conn['started']
+        if started:
             self.client.loop_stop()
             self.client.disconnect()
             print("Disconnected from MQTT broker")
@@ -300,6 +778,19 @@ def main():
     parser.add_argument('--duration', type=int, default=60, help='Simulation duration (seconds)')
     parser.add_argument('--interval', type=int, default=5, help='Publishing interval (seconds)')
     parser.add_argument('--single', action='store_true', help='Single publish and exit')
+    parser.add_argument('--asyncio', action='store_true', help='Run the continuous simulation on an asyncio event loop')
+    parser.add_argument('--format', choices=list(ENCODERS), default=DEFAULT_FORMAT,
+                        help='Payload encoding (msgpack publishes to <topic>/<channel>/msgpack; '
+                             'fast renders JSON from precomputed templates)')
+    parser.add_argument('--qos', type=int, choices=[0, 1, 2], default=0, help='MQTT QoS level')
+    parser.add_argument('--keyframe-interval', type=int, default=0,
+                        help='Continuous mode: full payload every N iterations, changed fields only in between (0 = always full)')
+    parser.add_argument('--batch', action='store_true',
+                        help='Publish all channels as one message on <topic>/bundle')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Run N simulator processes in parallel, each with its own MQTT client')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed the data generator for reproducible runs (worker i uses seed + i)')
     
     args = parser.parse_args()
     
@@ -309,10 +800,35 @@ def main():
     print(f"Broker: {args.host}:{args.port}")
     print(f"Topic: {args.topic}")
     print(f"Scan ID: {args.scan_id}")
+    print(f"Format: {args.format}")
+    print(f"Workers: {args.workers}")
     print("="*60)
     
+    if args.workers > 1:
+        # Independent processes, each with its own client, socket and RNG,
+        # publishing a scan_id of its own so their streams don't interleave
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [pool.submit(_run_worker, args, i) for i in range(args.workers)]
+            return max(f.result() for f in futures)
+    
+    return _run_simulator(args, args.scan_id, args.seed)
+
+
+def _run_worker(args, index: int) -> int:
+    """Process pool entry point for --workers"""
+    seed = None if args.seed is None else args.seed + index
+    return _run_simulator(args, f"{args.scan_id}-w{index}", seed)
+
+
+def _run_simulator(args, scan_id: str, seed: Optional[int] = None) -> int:
+    """Connect one simulator, run the requested mode and disconnect"""
     # Create simulator
-    simulator = SensorSimulator(args.host, args.port, args.topic)
+    try:
+        simulator = SensorSimulator(args.host, args.port, args.topic, args.format, args.batch, args.qos,
+                                    args.keyframe_interval, seed)
+    except ValueError as e:
+        print(f"✗ {e}")
+        return 1
     
     # Connect to broker
     if not simulator.connect():
@@ -322,9 +838,14 @@ def main():
     # Run simulation
     if args.single:
         print("\nPublishing single data set...")
-        simulator.publish_sensor_data(args.scan_id)
+        simulator.publish_sensor_data(scan_id)
+    elif args.asyncio:
+        try:
+            asyncio.run(simulator.simulate_continuous_async(scan_id, args.duration, args.interval))
+        except KeyboardInterrupt:
+            print("\n\nSimulation stopped by user")
     else:
-        simulator.simulate_continuous(args.scan_id, args.duration, args.interval)
+        simulator.simulate_continuous(scan_id, args.duration, args.interval)
     
     # Cleanup
     simulator.disconnect()
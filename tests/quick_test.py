@@ -4,7 +4,8 @@ Quick Test Script for MotoSpect System
 Tests basic connectivity to all services
 """
 
-import requests
+import asyncio
+import aiohttp
 import json
 import time
 from datetime import datetime
@@ -13,62 +14,65 @@ from datetime import datetime
 TEST_VIN = "1HGBH41JXMN109186"
 BACKEND_URL = "http://localhost:8000"
 
-def test_backend_health():
+async def test_backend_health(session: aiohttp.ClientSession):
     """Test if backend is running"""
     print("\n=== Testing Backend Health ===")
     try:
-        response = requests.get(f"{BACKEND_URL}/health", timeout=5)
-        if response.status_code == 200:
-            print("✓ Backend is running")
-            return True
-        else:
-            print(f"✗ Backend returned status {response.status_code}")
-            return False
-    except requests.exceptions.ConnectionError:
+        async with session.get("/health", timeout=aiohttp.ClientTimeout(total=5)) as response:
+            if response.status == 200:
+                print("✓ Backend is running")
+                return True
+            else:
+                print(f"✗ Backend returned status {response.status}")
+                return False
+    except aiohttp.ClientConnectionError:
         print("✗ Backend is not accessible at", BACKEND_URL)
         return False
     except Exception as e:
         print(f"✗ Error: {e}")
         return False
 
-def test_vin_decoder():
+async def test_vin_decoder(session: aiohttp.ClientSession):
     """Test VIN decoder endpoint"""
-    print("\n=== Testing VIN Decoder ===")
-    print(f"Test VIN: {TEST_VIN}")
+    out = ["\n=== Testing VIN Decoder ===", f"Test VIN: {TEST_VIN}"]
     try:
-        response = requests.get(f"{BACKEND_URL}/api/vin/{TEST_VIN}", timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✓ Vehicle: {data.get('make', 'Unknown')} {data.get('model', 'Unknown')} {data.get('year', 'Unknown')}")
-            return True
-        else:
-            print(f"✗ VIN decoder failed with status {response.status_code}")
-            return False
+        async with session.get(f"/api/vin/{TEST_VIN}") as response:
+            if response.status == 200:
+                data = await response.json()
+                out.append(f"✓ Vehicle: {data.get('make', 'Unknown')} {data.get('model', 'Unknown')} {data.get('year', 'Unknown')}")
+                return True
+            else:
+                out.append(f"✗ VIN decoder failed with status {response.status}")
+                return False
     except Exception as e:
-        print(f"✗ Error: {e}")
+        out.append(f"✗ Error: {e}")
         return False
+    finally:
+        print("\n".join(out))
 
-def test_vehicle_database():
+async def test_vehicle_database(session: aiohttp.ClientSession):
     """Test vehicle database endpoint"""
-    print("\n=== Testing Vehicle Database ===")
+    out = ["\n=== Testing Vehicle Database ==="]
     try:
-        response = requests.get(f"{BACKEND_URL}/api/vehicle/database/{TEST_VIN}", timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            print("✓ Vehicle database info retrieved")
-            if 'recalls' in data:
-                print(f"  - Recalls found: {len(data['recalls'])}")
-            return True
-        else:
-            print(f"✗ Vehicle database failed with status {response.status_code}")
-            return False
+        async with session.get(f"/api/vehicle/database/{TEST_VIN}") as response:
+            if response.status == 200:
+                data = await response.json()
+                out.append("✓ Vehicle database info retrieved")
+                if 'recalls' in data:
+                    out.append(f"  - Recalls found: {len(data['recalls'])}")
+                return True
+            else:
+                out.append(f"✗ Vehicle database failed with status {response.status}")
+                return False
     except Exception as e:
-        print(f"✗ Error: {e}")
+        out.append(f"✗ Error: {e}")
         return False
+    finally:
+        print("\n".join(out))
 
-def test_report_generation():
+async def test_report_generation(session: aiohttp.ClientSession):
     """Test report generation endpoint"""
-    print("\n=== Testing Report Generation ===")
+    out = ["\n=== Testing Report Generation ==="]
     
     report_data = {
         "vin": TEST_VIN,
@@ -89,30 +93,28 @@ def test_report_generation():
     }
     
     try:
-        response = requests.post(
-            f"{BACKEND_URL}/api/report/generate",
-            json=report_data,
-            timeout=10
-        )
-        if response.status_code == 200:
-            report = response.json()
-            print("✓ Report generated successfully")
-            if 'health_scores' in report:
-                overall = report['health_scores'].get('overall', 0)
-                print(f"  - Overall health: {overall}%")
-            if 'recommendations' in report:
-                print(f"  - Recommendations: {len(report['recommendations'])}")
-            return True
-        else:
-            print(f"✗ Report generation failed with status {response.status_code}")
-            return False
+        async with session.post("/api/report/generate", json=report_data) as response:
+            if response.status == 200:
+                report = await response.json()
+                out.append("✓ Report generated successfully")
+                if 'health_scores' in report:
+                    overall = report['health_scores'].get('overall', 0)
+                    out.append(f"  - Overall health: {overall}%")
+                if 'recommendations' in report:
+                    out.append(f"  - Recommendations: {len(report['recommendations'])}")
+                return True
+            else:
+                out.append(f"✗ Report generation failed with status {response.status}")
+                return False
     except Exception as e:
-        print(f"✗ Error: {e}")
+        out.append(f"✗ Error: {e}")
         return False
+    finally:
+        print("\n".join(out))
 
-def test_maintenance_schedule():
+async def test_maintenance_schedule(session: aiohttp.ClientSession):
     """Test maintenance schedule endpoint"""
-    print("\n=== Testing Maintenance Schedule ===")
+    out = ["\n=== Testing Maintenance Schedule ==="]
     
     params = {
         "make": "Honda",
@@ -122,25 +124,23 @@ def test_maintenance_schedule():
     }
     
     try:
-        response = requests.get(
-            f"{BACKEND_URL}/api/vehicle/maintenance",
-            params=params,
-            timeout=10
-        )
-        if response.status_code == 200:
-            maintenance = response.json()
-            print(f"✓ Maintenance schedule retrieved: {len(maintenance)} items")
-            for item in maintenance[:3]:
-                print(f"  - {item.get('service', 'Unknown')}: {item.get('interval_miles', 0)} miles")
-            return True
-        else:
-            print(f"✗ Maintenance schedule failed with status {response.status_code}")
-            return False
+        async with session.get("/api/vehicle/maintenance", params=params) as response:
+            if response.status == 200:
+                maintenance = await response.json()
+                out.append(f"✓ Maintenance schedule retrieved: {len(maintenance)} items")
+                for item in maintenance[:3]:
+                    out.append(f"  - {item.get('service', 'Unknown')}: {item.get('interval_miles', 0)} miles")
+                return True
+            else:
+                out.append(f"✗ Maintenance schedule failed with status {response.status}")
+                return False
     except Exception as e:
-        print(f"✗ Error: {e}")
+        out.append(f"✗ Error: {e}")
         return False
+    finally:
+        print("\n".join(out))
 
-def main():
+async def main():
     """Run all tests"""
     print("\n" + "="*60)
     print("   MOTOSPECT QUICK SYSTEM TEST")
@@ -153,13 +153,20 @@ def main():
     results = []
     
     # Run tests
-    results.append(("Backend Health", test_backend_health()))
-    
-    if results[0][1]:  # Only continue if backend is running
-        results.append(("VIN Decoder", test_vin_decoder()))
-        results.append(("Vehicle Database", test_vehicle_database()))
-        results.append(("Report Generation", test_report_generation()))
-        results.append(("Maintenance Schedule", test_maintenance_schedule()))
+    async with aiohttp.ClientSession(base_url=BACKEND_URL, timeout=aiohttp.ClientTimeout(total=10)) as session:
+        results.append(("Backend Health", await test_backend_health(session)))
+        
+        if results[0][1]:  # Only continue if backend is running
+            # The endpoint tests are independent, so run them concurrently;
+            # each prints its section in one piece once it finishes
+            names = ["VIN Decoder", "Vehicle Database", "Report Generation", "Maintenance Schedule"]
+            outcomes = await asyncio.gather(
+                test_vin_decoder(session),
+                test_vehicle_database(session),
+                test_report_generation(session),
+                test_maintenance_schedule(session),
+            )
+            results.extend(zip(names, outcomes))
     
     # Summary
     print("\n" + "="*60)
@@ -183,4 +190,4 @@ def main():
     return 0 if passed == total else 1
 
 if __name__ == "__main__":
-    exit(main())
+    exit(asyncio.run(main()))
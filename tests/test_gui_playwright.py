@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+pytest entry point for the MOTOSPECT GUI suite in gui_test_playwright.py
+
+`pytest tests/test_gui_playwright.py` (optionally with `-n auto`) runs every
+suite test as its own case. API probes only need an HTTP session; the UI
+tests share one browser per session/worker, and all fixtures and tests run
+on the session event loop so browser objects never cross loops.
+"""
+import pytest
+
+pytest.importorskip("playwright.async_api")
+pytest_asyncio = pytest.importorskip("pytest_asyncio")
+
+from gui_test_playwright import MotospectGUITests, close_playwright
+
+
+async def _run(suite: MotospectGUITests, test_name: str, *args):
+    """Run one suite test and fail the pytest case if it recorded a failure"""
+    errors_before = len(suite.test_results["errors"])
+    await getattr(suite, test_name)(*args)
+    new_errors = suite.test_results["errors"][errors_before:]
+    assert not new_errors, "; ".join(new_errors)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api_suite():
+    """HTTP-only suite for the API probes; no browser is launched"""
+    suite = MotospectGUITests()
+    await suite.setup(browser=False)
+    yield suite
+    await suite.teardown()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def gui_suite():
+    """Launch the browser once for the whole pytest session"""
+    suite = MotospectGUITests()
+    await suite.setup()
+    yield suite
+    await suite.teardown()
+    await close_playwright()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def context(gui_suite):
+    """Fresh browser context per test"""
+    ctx = await gui_suite.new_context()
+    yield ctx
+    await ctx.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def frontend_page(gui_suite):
+    """Frontend loaded once per session/worker for the shared read-only tests"""
+    ctx = await gui_suite.new_context()
+    try:
+        yield await gui_suite.frontend_page(ctx)
+    finally:
+        await ctx.close()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("test_name", MotospectGUITests.API_TESTS)
+async def test_api(api_suite, test_name):
+    await _run(api_suite, test_name)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("test_name", MotospectGUITests.SHARED_FRONTEND_TESTS)
+async def test_shared_frontend(gui_suite, frontend_page, test_name):
+    await _run(gui_suite, test_name, frontend_page)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("test_name", MotospectGUITests.TEST_METHODS + MotospectGUITests.SERIAL_TESTS)
+async def test_gui(gui_suite, context, test_name):
+    await _run(gui_suite, test_name, context)